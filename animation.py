@@ -0,0 +1,101 @@
+"""
+date : 2026 january 20
+description : Shared animation clips and a single animation clock.
+A clip holds its frames already scaled to one size and is shared by every sprite that
+plays it, so swapping frames never allocates a new Surface. The clock advances the frame
+of every registered sprite in one pass, replacing the per-sprite frame_timer bookkeeping.
+"""
+import weakref
+import assets
+
+
+class AnimationClip:
+    """A looping list of pre-scaled frames, each shown for `frame_duration` ms."""
+
+    def __init__(self, frames, frame_duration):
+        if not frames:
+            raise ValueError("An animation clip needs at least one frame")
+        self.frames = list(frames)
+        self.frame_duration = frame_duration
+        self.size = self.frames[0].get_size()
+
+    def index_at(self, elapsed):
+        """Return the frame index shown `elapsed` ms after the clip started."""
+        return int(elapsed // self.frame_duration) % len(self.frames)
+
+    def frame_at(self, elapsed):
+        """Return the frame shown `elapsed` ms after the clip started."""
+        return self.frames[self.index_at(elapsed)]
+
+
+# shared clips keyed by (paths, size, frame_duration, convert, rle)
+_clips = {}
+
+
+def get_clip(paths, size=None, frame_duration=100, convert="auto", rle=False):
+    """
+    Return the shared clip for these frame files, scaling them to `size` only the first time.
+    Frames are loaded through the asset cache (see AssetCache.load for convert / rle).
+    """
+    key = (tuple(assets.cache.normalize_path(p) for p in paths), tuple(size) if size else None, frame_duration, convert, rle)
+    clip = _clips.get(key)
+    if clip is None:
+        clip = AnimationClip(assets.load_frames(paths, size=size, convert=convert, rle=rle), frame_duration)
+        _clips[key] = clip
+    return clip
+
+
+def clear_clips():
+    """Forget every shared clip (the frames stay in the asset cache until evicted there)."""
+    _clips.clear()
+
+
+def evict_clips(path):
+    """Forget every shared clip that uses the image `path`. Returns the number removed."""
+    norm = assets.cache.normalize_path(path)
+    keys = [k for k in _clips if norm in k[0]]
+    for k in keys:
+        del _clips[k]
+    return len(keys)
+
+
+class AnimationClock:
+    """
+    Central clock that drives every animated sprite.
+    Sprites register with add(); tick(dt) is called once per frame and swaps the image of
+    every live sprite whose frame changed. Sprites are held weakly, so dropped sprites
+    disappear from the clock on their own.
+    """
+
+    def __init__(self):
+        self.time = 0
+        self._sprites = weakref.WeakKeyDictionary()
+
+    def add(self, sprite, clip):
+        """Start playing `clip` on `sprite` from its first frame."""
+        self._sprites[sprite] = (clip, self.time)
+        sprite.frame_index = 0
+        sprite.image = clip.frames[0]
+
+    def remove(self, sprite):
+        """Stop animating `sprite` (its current image is kept)."""
+        self._sprites.pop(sprite, None)
+
+    def tick(self, dt):
+        """Advance the clock by `dt` ms and update the frame of every live sprite."""
+        self.time += dt
+        for spr, (clip, start) in list(self._sprites.items()):
+            # sprites not in any group are frozen (killed or not placed yet)
+            if not spr.alive():
+                continue
+            index = clip.index_at(self.time - start)
+            if index != spr.frame_index:
+                spr.frame_index = index
+                spr.image = clip.frames[index]
+
+    def __len__(self):
+        return len(self._sprites)
+
+
+# shared clock ticked by the gameplay loop
+clock = AnimationClock()
@@ -0,0 +1,281 @@
+"""
+date : 2026 january 20
+description : Process-wide image (and sound) cache shared by every sprite class.
+Images are decoded from disk once and the (optionally scaled / converted) Surfaces are
+kept in memory, keyed by path, size and convert mode, so spawning a sprite no longer
+touches the disk. Images packed by `python atlas.py` are taken from the atlas pages, and
+big scaled images are also kept on disk between launches (see disk_cache.py).
+Every image is converted to the display pixel format by default ('auto'), so sprite blits
+never pay a per-pixel format conversion. Set MONSTER_DEBUG_FORMATS=1 (or pass
+debug_formats=True to App) to report unconverted Surfaces reaching the sprite, background,
+menu, slide, HUD or story blits.
+"""
+import os
+import time
+import pygame
+import telemetry
+from atlas import atlas
+from disk_cache import DiskPixelCache
+
+CONVERT_MODES = (None, "auto", "convert", "alpha")
+
+
+def has_alpha(surface):
+    """Return True if `surface` has per-pixel alpha or a colorkey."""
+    return bool(surface.get_flags() & pygame.SRCALPHA) or surface.get_colorkey() is not None
+
+
+def is_display_format(surface):
+    """
+    Return True if `surface` can be blitted to the display without a per-pixel conversion,
+    i.e. it has the layout convert() or convert_alpha() produces.
+    An opaque surface that still carries an alpha mask (e.g. a "BGRA" buffer with
+    set_alpha(None)) is not converted. Always True while no display mode is set.
+    """
+    display = pygame.display.get_surface()
+    if display is None:
+        return True
+    masks = surface.get_masks()
+    if masks[:3] != display.get_masks()[:3]:
+        return False
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.get_bitsize() == 32 and masks[3] != 0
+    return masks[3] == display.get_masks()[3] and surface.get_bitsize() == display.get_bitsize()
+
+
+def accelerate(surface):
+    """Turn on RLE acceleration for a surface with transparent pixels (faster blits, slower pixel access)."""
+    colorkey = surface.get_colorkey()
+    if colorkey is not None:
+        surface.set_colorkey(colorkey, pygame.RLEACCEL)
+    elif surface.get_flags() & pygame.SRCALPHA:
+        surface.set_alpha(255, pygame.RLEACCEL)
+    return surface
+
+
+class AssetCache:
+    """
+    Caches decoded Surfaces keyed by (path, size, convert).
+    The returned Surfaces are shared between every caller, so they must be treated as
+    read-only: copy() one first if it is going to be drawn on or have its alpha changed.
+    """
+
+    def __init__(self, disk=None, telemetry=None):
+        """
+        disk: optional DiskPixelCache used for big scaled images, so later launches
+              map the scaled pixels from disk instead of decoding and scaling again
+        telemetry: optional telemetry.AssetTelemetry told about every decode / scale
+        """
+        self._images = {}
+        self._sounds = {}
+        self.disk = disk
+        self.telemetry = telemetry
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize_path(path):
+        """
+        Return a canonical key for `path`.
+        Some sprites use Windows style paths (src\\Images\\...), so both separators are accepted.
+        """
+        return os.path.normpath(path.replace("\\", "/"))
+
+    def _key(self, path, size, convert, rle=False):
+        return (self.normalize_path(path), tuple(size) if size else None, convert, rle)
+
+    def load(self, path, size=None, convert="auto", rle=False):
+        """
+        Return the Surface for `path`, decoding it only the first time it is requested.
+        path: image file path (either separator style)
+        size: optional (w, h) to scale the image to
+        convert: 'auto' (default) converts to the display format, keeping alpha only when the
+                 image has transparency; 'convert' or 'alpha' force convert()/convert_alpha();
+                 None keeps the file's pixel format
+        rle: turn on RLE acceleration (for sprites with large transparent areas)
+        """
+        if convert not in CONVERT_MODES:
+            raise ValueError(f"Unknown convert mode: {convert}")
+        key = self._key(path, size, convert, rle)
+        surface = self._images.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        self.misses += 1
+
+        if self.disk is not None and self.disk.wants(size):
+            surface = self._load_from_disk(key[0], key[1], convert)
+        else:
+            surface = self._build(key[0], key[1], convert)
+        if rle:
+            accelerate(surface)
+        # without a display 'auto' cannot convert yet; do not keep the unconverted copy
+        if convert != "auto" or pygame.display.get_surface() is not None:
+            self._images[key] = surface
+        return surface
+
+    def _load_from_disk(self, path, size, convert):
+        """Map the scaled image from the disk cache, building and storing it on a miss."""
+        if convert == "auto":
+            # the stored file tells whether the image was opaque
+            start = time.perf_counter()
+            surface = self.disk.load(path, size, True) if self.disk.has(path, size, True) else None
+            if surface is None:
+                surface = self.disk.load(path, size, False)
+            if surface is not None:
+                self._record(path, surface, time.perf_counter() - start)
+            opaque = None
+        else:
+            # 'alpha' and unconverted images keep their alpha channel
+            opaque = convert == "convert"
+            start = time.perf_counter()
+            surface = self.disk.load(path, size, opaque)
+            if surface is not None:
+                self._record(path, surface, time.perf_counter() - start)
+        if surface is None:
+            # the big raw decode is not kept in memory, the disk copy replaces it
+            surface = self._build(path, size, convert, keep_raw=False)
+            if opaque is None:
+                opaque = not surface.get_flags() & pygame.SRCALPHA
+            try:
+                self.disk.store(path, surface, opaque)
+            except OSError:
+                # read-only install or full disk: keep the in-memory copy only
+                pass
+        return surface
+
+    def _build(self, path, size, convert, keep_raw=True):
+        """Decode (or reuse the raw decode of) `path`, then scale and convert it."""
+        # build from the raw decoded image so every variant only decodes the file once
+        raw_key = self._key(path, None, None)
+        surface = self._images.get(raw_key)
+        decode = 0.0
+        if surface is None:
+            start = time.perf_counter()
+            # prefer the packed atlas page, fall back to the image file
+            surface = atlas.get(raw_key[0])
+            if surface is None:
+                surface = pygame.image.load(raw_key[0])
+            decode = time.perf_counter() - start
+            if keep_raw:
+                self._images[raw_key] = surface
+                self._record(path, surface, decode)
+                decode = 0.0
+        start = time.perf_counter()
+        if size:
+            surface = pygame.transform.scale(surface, size)
+        if convert == "auto":
+            convert = None
+            if pygame.display.get_surface() is not None:
+                convert = "alpha" if has_alpha(surface) else "convert"
+        if convert == "convert":
+            surface = surface.convert()
+        elif convert == "alpha":
+            surface = surface.convert_alpha()
+        self._record(path, surface, decode, time.perf_counter() - start)
+        return surface
+
+    def _record(self, path, surface, decode=0.0, scale=0.0):
+        if self.telemetry is not None:
+            self.telemetry.record(path, surface, decode, scale)
+
+    def store_raw(self, path, surface):
+        """Seed the cache with an already decoded image (see preload.py); later loads scale/convert it."""
+        self._images[self._key(path, None, None)] = surface
+        self._record(self.normalize_path(path), surface)
+
+    def load_sound(self, path):
+        """Return the shared pygame.mixer.Sound for `path`, decoding the file only once."""
+        key = self.normalize_path(path)
+        sound = self._sounds.get(key)
+        if sound is not None:
+            self.hits += 1
+            return sound
+        self.misses += 1
+        start = time.perf_counter()
+        sound = pygame.mixer.Sound(key)
+        if self.telemetry is not None:
+            self.telemetry.record_sound(key, sound, time.perf_counter() - start)
+        self._sounds[key] = sound
+        return sound
+
+    def load_frames(self, paths, size=None, convert="auto", rle=False):
+        """Load a list of animation frames through the cache."""
+        return [self.load(p, size=size, convert=convert, rle=rle) for p in paths]
+
+    def evict(self, path=None):
+        """
+        Drop cached Surfaces.
+        path: evict every size/convert variant of this image; when None the whole cache is cleared.
+        Returns the number of entries removed.
+        """
+        if path is None:
+            removed = len(self._images) + len(self._sounds)
+            self._images.clear()
+            self._sounds.clear()
+            return removed
+        norm = self.normalize_path(path)
+        keys = [k for k in self._images if k[0] == norm]
+        for k in keys:
+            del self._images[k]
+        if self._sounds.pop(norm, None) is not None:
+            keys.append(norm)
+        return len(keys)
+
+    def reset_stats(self):
+        """Reset the hit/miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Return a dict with the hit/miss counters and the number of cached entries."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._images) + len(self._sounds)}
+
+
+class FormatAudit:
+    """
+    Debug check for Surfaces that reach a blit in a non-display format.
+    Each offending (owner, size, format) is reported once.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.reported = set()
+
+    def check(self, surface, owner):
+        """Report `surface` (drawn for `owner`, e.g. a sprite class name) if it is not converted."""
+        if not self.enabled or is_display_format(surface):
+            return True
+        entry = (owner, surface.get_size(), surface.get_bitsize(), surface.get_masks())
+        if entry not in self.reported:
+            self.reported.add(entry)
+            print(f"Unconverted surface blitted: {owner} {surface.get_size()} "
+                  f"{surface.get_bitsize()}bpp masks={surface.get_masks()}")
+        return False
+
+    def check_group(self, group):
+        """Check the image of every sprite in `group` (call right before group.draw)."""
+        if not self.enabled:
+            return
+        for spr in group:
+            self.check(spr.image, type(spr).__name__)
+
+
+# shared instance used by sprite.py and the screens
+cache = AssetCache(disk=DiskPixelCache(), telemetry=telemetry.tracker)
+audit = FormatAudit(enabled=bool(os.environ.get("MONSTER_DEBUG_FORMATS")))
+
+
+def load_image(path, size=None, convert="auto", rle=False):
+    """Shortcut for cache.load(), see AssetCache.load."""
+    return cache.load(path, size=size, convert=convert, rle=rle)
+
+
+def load_frames(paths, size=None, convert="auto", rle=False):
+    """Shortcut for cache.load_frames(), see AssetCache.load_frames."""
+    return cache.load_frames(paths, size=size, convert=convert, rle=rle)
+
+
+def load_sound(path):
+    """Shortcut for cache.load_sound(), see AssetCache.load_sound."""
+    return cache.load_sound(path)
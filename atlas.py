@@ -0,0 +1,172 @@
+"""
+date : 2026 january 20
+description : Texture atlas packer and atlas-backed image loader.
+Run `python atlas.py` to pack the small sprite images under src/Images into a few atlas
+pages plus an index of named sub-rects (src/Atlas). When the atlas exists the asset cache
+takes images from it as subsurfaces, so the game decodes one page instead of opening
+dozens of small files. Re-run the build after changing any packed image.
+"""
+import os
+import pygame
+from json_loader import load_json, dump_json
+
+ATLAS_DIR = os.path.join("src", "Atlas")
+INDEX_FILE = "atlas.json"
+
+# folders (under src/Images) whose images are packed
+SOURCE_DIRS = [
+    "player_animation",
+    "enemy",
+    "weapon",
+    "map/obstacles",
+    "portals",
+    "effect",
+]
+IMAGE_EXTENSIONS = (".png", ".gif")
+PAGE_SIZE = 1024
+# images bigger than this (either side) are left as separate files
+MAX_IMAGE_SIDE = 512
+PADDING = 1
+
+
+def image_name(path):
+    """Return the atlas name of an image path: normalized, with forward slashes."""
+    return os.path.normpath(path.replace("\\", "/")).replace(os.sep, "/")
+
+
+def collect_images(root=os.path.join("src", "Images"), source_dirs=SOURCE_DIRS):
+    """Return the sorted list of image paths that should be packed."""
+    paths = []
+    for folder in source_dirs:
+        base = os.path.join(root, folder)
+        for dirpath, _, filenames in os.walk(base):
+            for filename in filenames:
+                if filename.lower().endswith(IMAGE_EXTENSIONS):
+                    paths.append(os.path.join(dirpath, filename))
+    return sorted(paths)
+
+
+def pack(sizes, page_size=PAGE_SIZE, padding=PADDING):
+    """
+    Shelf-pack rectangles into square pages.
+    sizes: dict of name -> (w, h)
+    Returns a dict of name -> (page, x, y) and the number of pages used.
+    Tallest images are placed first, each shelf is as tall as its first image.
+    """
+    placements = {}
+    page = 0
+    x = y = shelf_h = 0
+    for name in sorted(sizes, key=lambda n: (-sizes[n][1], -sizes[n][0], n)):
+        w, h = sizes[name]
+        if w + padding > page_size or h + padding > page_size:
+            raise ValueError(f"{name} ({w}x{h}) does not fit in a {page_size}px atlas page")
+        if x + w + padding > page_size:
+            # start a new shelf
+            x = 0
+            y += shelf_h
+            shelf_h = 0
+        if y + h + padding > page_size:
+            # start a new page
+            page += 1
+            x = y = shelf_h = 0
+        placements[name] = (page, x, y)
+        x += w + padding
+        shelf_h = max(shelf_h, h + padding)
+    page_count = page + 1 if placements else 0
+    return placements, page_count
+
+
+def build_atlas(paths=None, out_dir=ATLAS_DIR, page_size=PAGE_SIZE):
+    """
+    Pack `paths` (default: collect_images()) into atlas pages and write the index.
+    Images are blitted onto transparent 32-bit pages, so GIF colorkeys become alpha.
+    Returns the index dict that was written.
+    """
+    if paths is None:
+        paths = collect_images()
+    images = {}
+    skipped = []
+    for path in paths:
+        img = pygame.image.load(path)
+        w, h = img.get_size()
+        if w > MAX_IMAGE_SIDE or h > MAX_IMAGE_SIDE:
+            skipped.append(path)
+            continue
+        images[image_name(path)] = img
+
+    placements, page_count = pack({name: img.get_size() for name, img in images.items()}, page_size)
+
+    if not os.path.exists(out_dir):
+        os.makedirs(out_dir)
+    pages = [pygame.Surface((page_size, page_size), pygame.SRCALPHA, 32) for _ in range(page_count)]
+    index = {"pages": [f"atlas_{i}.png" for i in range(page_count)], "images": {}}
+    for name, (page, x, y) in placements.items():
+        img = images[name]
+        pages[page].blit(img, (x, y))
+        index["images"][name] = [page, x, y, img.get_width(), img.get_height()]
+    for filename, surface in zip(index["pages"], pages):
+        pygame.image.save(surface, os.path.join(out_dir, filename))
+    dump_json(index, os.path.join(out_dir, INDEX_FILE))
+
+    print(f"Packed {len(placements)} images into {page_count} page(s) in {out_dir}")
+    for path in skipped:
+        print(f"  skipped (too large): {path}")
+    return index
+
+
+class Atlas:
+    """
+    Loads atlas pages on demand and hands out named images as subsurfaces.
+    If no atlas has been built every lookup returns None and callers load the file instead.
+    """
+
+    def __init__(self, directory=ATLAS_DIR):
+        self.directory = directory
+        self._index = None
+        self._pages = {}
+
+    def _load_index(self):
+        if self._index is None:
+            index_path = os.path.join(self.directory, INDEX_FILE)
+            data = load_json(index_path) if os.path.exists(index_path) else None
+            if not isinstance(data, dict) or "images" not in data:
+                data = {"pages": [], "images": {}}
+            self._index = data
+        return self._index
+
+    def available(self):
+        """Return True when an atlas index with at least one image exists."""
+        return bool(self._load_index()["images"])
+
+    def __contains__(self, name):
+        return image_name(name) in self._load_index()["images"]
+
+    def names(self):
+        """Return the names of every packed image."""
+        return list(self._load_index()["images"])
+
+    def get(self, name):
+        """Return the packed image `name` as a subsurface of its page, or None if it is not packed."""
+        index = self._load_index()
+        entry = index["images"].get(image_name(name))
+        if entry is None:
+            return None
+        page, x, y, w, h = entry
+        surface = self._pages.get(page)
+        if surface is None:
+            surface = pygame.image.load(os.path.join(self.directory, index["pages"][page]))
+            self._pages[page] = surface
+        return surface.subsurface((x, y, w, h))
+
+    def unload(self):
+        """Forget the decoded pages and the index (they are reloaded on the next get)."""
+        self._pages.clear()
+        self._index = None
+
+
+# shared atlas used by the asset cache
+atlas = Atlas()
+
+
+if __name__ == "__main__":
+    build_atlas()
@@ -0,0 +1,220 @@
+"""
+date : 2026 january 20
+description : Scrolling level background split into fixed-width tiles.
+Instead of scaling the level art to one 10000x600 Surface, the level is cut into tiles
+of TILE_WIDTH pixels, all scaled in one pass on first use (or by the warm-up queue) and kept
+in the pixel disk cache; the decoded level art is dropped right after. Only the tiles
+overlapping the viewport are blitted, and tiles far from the camera are dropped (they are
+mapped back from disk when the camera returns, or scaled again on a read-only install).
+One TiledBackground is kept per level, so respawning reuses it.
+"""
+import time
+import pygame
+import assets
+
+TILE_WIDTH = 512
+# tiles kept on each side of the viewport before they are evicted
+KEEP_MARGIN = 2
+
+
+class TiledBackground:
+    """
+    The image `path` scaled to `world_size`, built and drawn one vertical tile at a time.
+    The decoded source image is only held while tiles are being scaled.
+    """
+
+    def __init__(self, path, world_size, tile_width=TILE_WIDTH, disk=None):
+        self.path = assets.cache.normalize_path(path)
+        self.world_width, self.world_height = world_size
+        self.tile_width = tile_width
+        self.disk = disk
+        self.count = -(-self.world_width // tile_width)
+        self._tiles = {}
+        self._stored = set()
+        self.writable = disk is not None
+        self._source = None
+        self._column_map = None
+        self.built = 0
+
+    def __len__(self):
+        """Number of tiles currently in memory."""
+        return len(self._tiles)
+
+    def tile_rect(self, index):
+        """Return the world-space rect covered by tile `index`."""
+        x = index * self.tile_width
+        return pygame.Rect(x, 0, min(self.tile_width, self.world_width - x), self.world_height)
+
+    def _tag(self, index):
+        # v2: tiles scaled column-exact (earlier tiles could be shifted by a column at their seams)
+        return f"{self.world_width}x{self.world_height}_tile{index}v2"
+
+    def _columns(self):
+        """
+        Return the source column of every world column, read back from transform.scale
+        itself (a row of column indices scaled to the world width), so a tile holds
+        exactly the pixels a full-size scale would.
+        """
+        if self._column_map is None:
+            src_w = self._source.get_width()
+            row = bytearray(4 * src_w)
+            for x in range(src_w):
+                row[4 * x:4 * x + 3] = x.to_bytes(3, "little")
+            index = pygame.image.frombytes(bytes(row), (src_w, 1), "RGBX")
+            scaled = pygame.image.tobytes(pygame.transform.scale(index, (self.world_width, 1)), "RGBX")
+            self._column_map = [int.from_bytes(scaled[i:i + 3], "little") for i in range(0, len(scaled), 4)]
+        return self._column_map
+
+    def _scale_tile(self, index):
+        """Scale the part of the source image under tile `index`, pixel for pixel as transform.scale would."""
+        if self._source is None:
+            start = time.perf_counter()
+            self._source = pygame.image.load(self.path)
+            self._record(self._source, decode=time.perf_counter() - start)
+        start = time.perf_counter()
+        rect = self.tile_rect(index)
+        columns = self._columns()[rect.left:rect.right]
+        left, right = columns[0], columns[-1] + 1
+        # the source columns under the tile, scaled to the world height only (rows map as in a full scale)
+        strip = self._source.subsurface((left, 0, right - left, self._source.get_height()))
+        strip = pygame.transform.scale(strip, (right - left, self.world_height))
+        # then each tile column is copied from the strip column the full scale would pick
+        alpha = strip.get_flags() & pygame.SRCALPHA
+        tile = pygame.Surface(rect.size, alpha, strip)
+        copy = pygame.BLEND_RGBA_MAX if alpha else 0
+        tile.blits([(strip, (x, 0), (column - left, 0, 1, self.world_height), copy)
+                    for x, column in enumerate(columns)], False)
+        if pygame.display.get_surface():
+            tile = tile.convert()
+        self._record(tile, scale=time.perf_counter() - start)
+        return tile
+
+    def _on_disk(self, index):
+        """True when tile `index` is in the disk cache, so it can be mapped back at any time."""
+        if index not in self._stored and self.disk is not None \
+                and self.disk.has(self.path, self.tile_rect(index).size, True, self._tag(index)):
+            self._stored.add(index)
+        return index in self._stored
+
+    def _map(self, index):
+        """Map tile `index` back from the disk cache; None when it is not there."""
+        if self.disk is None:
+            return None
+        start = time.perf_counter()
+        surface = self.disk.load(self.path, self.tile_rect(index).size, True, self._tag(index))
+        if surface is not None:
+            self._stored.add(index)
+            self._record(surface, decode=time.perf_counter() - start)
+        return surface
+
+    def _store(self, index, surface):
+        """Keep tile `index` in the disk cache; returns False when it cannot be stored."""
+        if not self.writable:
+            return False
+        try:
+            self.disk.store(self.path, surface, True, self._tag(index))
+        except OSError:
+            # read-only install: tiles can only live in memory
+            self.writable = False
+            return False
+        self._stored.add(index)
+        return True
+
+    def _release(self):
+        """Drop the decoded source image (it is decoded again if a tile has to be scaled later)."""
+        self._source = None
+        self._column_map = None
+
+    def tile(self, index):
+        """
+        Return tile `index`, mapping it from disk or scaling it on first use.
+        Scaling decodes the source image once for the whole level: every tile not on disk yet is
+        scaled and stored in the same pass (only the tiles near `index` when nothing can be
+        stored), then the source is dropped.
+        """
+        surface = self._tiles.get(index)
+        if surface is None:
+            surface = self._map(index)
+        if surface is None:
+            surface = self._scale_tile(index)
+            self.built += 1
+            self._store(index, surface)
+            near = range(index - KEEP_MARGIN, index + KEEP_MARGIN + 1)
+            for other in range(self.count):
+                if other == index or other in self._tiles or self._on_disk(other):
+                    continue
+                if self.writable or other in near:
+                    built = self._scale_tile(other)
+                    self.built += 1
+                    self._store(other, built)
+                    if other in near:
+                        self._tiles[other] = built
+            self._release()
+        self._tiles[index] = surface
+        return surface
+
+    def _record(self, surface, decode=0.0, scale=0.0):
+        if assets.cache.telemetry is not None:
+            assets.cache.telemetry.record(self.path, surface, decode, scale, owner="Background")
+
+    def visible(self, offset_x, view_width):
+        """Return the range of tile indices overlapping a viewport of `view_width` at `offset_x`."""
+        first = max(0, -offset_x // self.tile_width)
+        last = min(self.count - 1, (view_width - 1 - offset_x) // self.tile_width)
+        return range(first, last + 1)
+
+    def build(self, index):
+        """
+        Scale and store tile `index` now, without keeping it in memory (one warm-up task).
+        The source stays decoded between tasks and is dropped once every tile is on disk.
+        """
+        if index in self._tiles or self._on_disk(index) or not self.writable:
+            # nothing to do, or nothing that could be kept: the tile is scaled when first drawn
+            return
+        tile = self._scale_tile(index)
+        self.built += 1
+        if not self._store(index, tile) or len(self._stored) == self.count:
+            self._release()
+
+    def evict_far(self, visible, margin=KEEP_MARGIN):
+        """Drop the tiles more than `margin` tiles away from `visible` (mapped back or scaled again when needed)."""
+        for index in list(self._tiles):
+            if not visible.start - margin <= index < visible.stop + margin:
+                del self._tiles[index]
+
+    def draw(self, surface, offset_x, offset_y=0):
+        """Blit the tiles overlapping `surface` with the world origin at (offset_x, offset_y)."""
+        visible = self.visible(offset_x, surface.get_width())
+        tiles = [self.tile(i) for i in visible]
+        for tile in tiles:
+            assets.audit.check(tile, "Background")
+        surface.blits([(tile, (offset_x + i * self.tile_width, offset_y)) for i, tile in zip(visible, tiles)], False)
+        self.evict_far(visible)
+
+    def unload(self):
+        """Forget every tile and the source image."""
+        self._tiles.clear()
+        self._release()
+
+
+# one tiled background per (level image, world size)
+_backgrounds = {}
+
+
+def get_background(path, world_size):
+    """Return the shared TiledBackground of `path` at `world_size`."""
+    key = (assets.cache.normalize_path(path), tuple(world_size))
+    background = _backgrounds.get(key)
+    if background is None:
+        background = TiledBackground(path, world_size, disk=assets.cache.disk)
+        _backgrounds[key] = background
+    return background
+
+
+def evict(path):
+    """Unload every tiled background made from `path`. Returns the number removed."""
+    norm = assets.cache.normalize_path(path)
+    keys = [k for k in _backgrounds if k[0] == norm]
+    for k in keys:
+        _backgrounds.pop(k).unload()
+    return len(keys)
@@ -0,0 +1,158 @@
+"""
+date : 2026 january 20
+description : Level- and screen-scoped asset bundles.
+Each level and screen has a manifest of the images and sounds it needs. Screens acquire
+their bundle when they start and release it when they leave; when nothing references an
+asset any more it is evicted from the asset cache, so memory stays flat across long
+sessions. The next bundle can be preloaded through the warm-up queue.
+"""
+import pygame
+import animation
+import assets
+import background_tiles
+import sound_bank
+import sprite
+import world_scale
+
+LEVEL_BACKGROUNDS = {1: "src/Images/map/Battleground1.png", 2: "src/Images/map/Battleground2.png"}
+LEVEL_SIZE = (10000, 600)
+
+
+def _images(paths, size=None, convert="auto"):
+    return [("image", p, size, convert) for p in paths]
+
+
+def level_background(level):
+    """Return the background image path of `level`."""
+    return LEVEL_BACKGROUNDS.get(level, LEVEL_BACKGROUNDS[1])
+
+
+def gameplay_manifest():
+    """Sprites, weapons and sounds shared by every level."""
+    specs = []
+    for files in sprite.Player.FRAME_FILES.values():
+        specs += _images(files, sprite.Player.SIZE)
+    for files, size in ((sprite.Enemy.FRAMES_ROOT, (60, 60)), (sprite.Enemy.FRAMES_BAT, (30, 30)), (sprite.Enemy.FRAMES_TREE, (80, 80))):
+        specs += _images(files, size, "alpha")
+    specs += _images(sprite.Portal.FRAMES, sprite.Portal.SIZE)
+    for size in ((80, 80), None, (50, 50), (60, 60)):
+        specs += _images(sprite.FIREBALL_FRAMES, size)
+    specs += [("sound", path) for path, _, _ in sound_bank.EFFECTS.values()]
+    return specs
+
+
+def level_tiles(level):
+    """Return the shared TiledBackground of `level`."""
+    return background_tiles.get_background(level_background(level), LEVEL_SIZE)
+
+
+def level_manifest(level, render_scale=1):
+    """The tiled level background (built at `render_scale` of LEVEL_SIZE, see world_scale.py) and the boss."""
+    return ([("background", level_background(level), world_scale.scaled_size(LEVEL_SIZE, render_scale))]
+            + _images(sprite.Boss.FRAMES, sprite.Boss.SIZE, "alpha"))
+
+
+def get_manifest(name, render_scale=1):
+    """
+    Return the asset specs of bundle `name`:
+    'gameplay', 'level1', 'level2' or 'menu'.
+    render_scale: share of the window resolution the level world is drawn at
+    """
+    if name == "gameplay":
+        return gameplay_manifest()
+    if name.startswith("level"):
+        return level_manifest(int(name[len("level"):]), render_scale)
+    if name == "menu":
+        return _images(["src/Images/intro/menu.png"], (2000, 600), "convert")
+    raise KeyError(f"Unknown asset bundle: {name}")
+
+
+def _load(spec):
+    if spec[0] == "sound":
+        return assets.load_sound(spec[1])
+    if spec[0] == "background":
+        # the first screen of tiles; the rest is scaled while scrolling
+        tiles = background_tiles.get_background(spec[1], spec[2])
+        return [tiles.tile(i) for i in tiles.visible(0, tiles.tile_width * 2)]
+    _, path, size, convert = spec
+    return assets.load_image(path, size, convert)
+
+
+class BundleLoader:
+    """
+    Reference-counts bundles and evicts their assets when the last user releases them.
+    Assets that are also listed in another acquired bundle are kept.
+    render_scale: the level backgrounds are built at this share of LEVEL_SIZE (set by the App)
+    """
+
+    def __init__(self):
+        self.render_scale = 1
+        self._manifests = {}
+        self._refs = {}
+        self.missing = set()
+
+    def manifest(self, name):
+        if name not in self._manifests:
+            self._manifests[name] = get_manifest(name, self.render_scale)
+        return self._manifests[name]
+
+    def refcount(self, name):
+        return self._refs.get(name, 0)
+
+    def loaded(self):
+        """Names of the bundles that are currently acquired."""
+        return [name for name, count in self._refs.items() if count > 0]
+
+    def _load_spec(self, spec):
+        if spec[1] in self.missing:
+            return
+        try:
+            _load(spec)
+        except (pygame.error, OSError):
+            # missing story art / sound: the screen falls back the same way it always did
+            self.missing.add(spec[1])
+
+    def acquire(self, name, load=True):
+        """
+        Take a reference on bundle `name`.
+        load: load every asset now; pass False to only pin the bundle (e.g. when the
+              warm-up queue is already loading it).
+        """
+        self._refs[name] = self._refs.get(name, 0) + 1
+        if load:
+            for spec in self.manifest(name):
+                self._load_spec(spec)
+
+    def release(self, name):
+        """Drop a reference on bundle `name`; unload its assets when nobody uses them any more."""
+        count = self._refs.get(name, 0) - 1
+        if count > 0:
+            self._refs[name] = count
+            return
+        self._refs.pop(name, None)
+        still_used = set()
+        for other in self.loaded():
+            still_used.update(spec[1] for spec in self.manifest(other))
+        for spec in self.manifest(name):
+            path = spec[1]
+            if path not in still_used:
+                assets.cache.evict(path)
+                animation.evict_clips(path)
+                background_tiles.evict(path)
+
+    def preload(self, name, queue):
+        """
+        Queue the loads of bundle `name` on a WarmupQueue so they happen in idle time
+        (a tiled background gets one task per tile).
+        """
+        for spec in self.manifest(name):
+            if spec[0] == "background":
+                tiles = background_tiles.get_background(spec[1], spec[2])
+                for index in range(tiles.count):
+                    queue.add(f"{name}: {spec[1]} tile {index}", lambda tiles=tiles, index=index: tiles.build(index))
+            else:
+                queue.add(f"{name}: {spec[1]}", lambda spec=spec: self._load_spec(spec))
+
+
+# shared loader used by the game and the screens
+loader = BundleLoader()
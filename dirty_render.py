@@ -0,0 +1,114 @@
+"""
+date : 2026 january 20
+description : Optional dirty-rectangle rendering.
+With the renderer enabled, a frame only redraws and presents the regions that changed:
+screens that did not change present nothing, and the gameplay screen redraws the rects
+moved sprites, HUD items and the pause menu touched, then hands them to
+pygame.display.update(rects) instead of flipping the whole window. A scrolling background
+changes the whole view, so those frames still redraw and flip everything.
+"""
+import pygame
+
+
+def merge(rects, limit=16, bounds=None):
+    """
+    Return `rects` with overlapping rects joined (empty ones dropped).
+    bounds: rect the result is clipped to (e.g. the screen), None to keep rects whole
+    More than `limit` rects are joined into their bounding rect.
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect) if bounds is None else bounds.clip(rect)
+        if not rect.w or not rect.h:
+            continue
+        # join with everything it overlaps until nothing overlaps any more
+        i = rect.collidelist(merged)
+        while i != -1:
+            rect.union_ip(merged.pop(i))
+            i = rect.collidelist(merged)
+        merged.append(rect)
+    if len(merged) > limit:
+        return [merged[0].unionall(merged[1:])]
+    return merged
+
+
+class SpriteTracker:
+    """
+    Remembers where each sprite of a group was drawn, like pygame's LayeredDirty.
+    A sprite is dirty when its rect or image object changed, when it was added or removed,
+    or when it sets `dirty` (1 = once, 2 = every frame) after changing its image in place.
+    """
+
+    def __init__(self):
+        self._drawn = {}
+
+    def changed(self, sprites):
+        """Return the rects to redraw so the screen matches `sprites` (old and new positions)."""
+        rects = []
+        drawn = {}
+        for spr in sprites:
+            state = (tuple(spr.rect), id(spr.image))
+            old = self._drawn.pop(spr, None)
+            dirty = getattr(spr, "dirty", 0)
+            if old is None:
+                rects.append(spr.rect)
+            elif old != state or dirty:
+                rects.append(pygame.Rect(old[0]))
+                rects.append(spr.rect)
+            if dirty == 1:
+                spr.dirty = 0
+            drawn[spr] = state
+        # sprites gone since the last frame leave their old rect behind
+        rects.extend(pygame.Rect(rect) for rect, _ in self._drawn.values())
+        self._drawn = drawn
+        return rects
+
+    def reset(self):
+        """Forget every sprite (the next changed() reports all of them)."""
+        self._drawn.clear()
+
+
+class DirtyRenderer:
+    """
+    Presents frames either whole or as a list of changed rects.
+    enabled: False keeps the plain full-window flip on every frame
+    full_ratio: changed area (fraction of the window) above which a frame is flipped whole
+    """
+
+    def __init__(self, enabled=False, full_ratio=0.5):
+        self.enabled = enabled
+        self.full_ratio = full_ratio
+        self.frames = 0
+        self.full = 0
+        self.skipped = 0
+        self.pixels = 0
+
+    def worth_partial(self, rects, size):
+        """True when redrawing only `rects` is cheaper than redrawing a window of `size`."""
+        area = sum(rect.w * rect.h for rect in rects)
+        return area <= self.full_ratio * size[0] * size[1]
+
+    def present(self, rects=None):
+        """Show the frame: None flips the whole window, a list updates only those rects (nothing when empty)."""
+        self.frames += 1
+        surface = pygame.display.get_surface()
+        if not self.enabled or rects is None:
+            self.full += 1
+            self.pixels += surface.get_width() * surface.get_height()
+            pygame.display.flip()
+        elif rects:
+            self.pixels += sum(rect.w * rect.h for rect in rects)
+            pygame.display.update(rects)
+        else:
+            self.skipped += 1
+
+    def stats(self):
+        """Return a dict with the frame counters and the average share of the window presented per frame."""
+        surface = pygame.display.get_surface()
+        window = surface.get_width() * surface.get_height() if surface else 1
+        fill = self.pixels / (window * self.frames) if self.frames else 0.0
+        return {"frames": self.frames, "full": self.full, "skipped": self.skipped, "fill": round(fill, 3)}
+
+
+# shared renderer, configured by the App
+renderer = DirtyRenderer()
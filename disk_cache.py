@@ -0,0 +1,132 @@
+"""
+date : 2026 january 20
+description : Persistent cache of decoded, already-scaled pixel buffers.
+The first launch stores the raw pixels of big scaled images (backgrounds, menu art) in
+cache/pixels. Later launches memory-map those files and wrap them with
+pygame.image.frombuffer, so the image is neither decoded nor scaled again (opaque images
+are copied once into the display layout where pygame cannot map them without alpha).
+Files are keyed by the source file's hash, the size and the pixel format, so editing an
+image simply produces a new entry; clear() removes the stale ones.
+"""
+import hashlib
+import mmap
+import os
+import pygame
+
+CACHE_DIR = os.path.join("cache", "pixels")
+
+
+def map_opaque(buffer, size):
+    """
+    Wrap an opaque BGRX buffer in a Surface without an alpha channel.
+    A "BGRA" wrap would keep its alpha mask (set_alpha(None) does not remove it), so every
+    blit would convert it pixel by pixel. pygame builds that cannot wrap "BGRX" copy the
+    pixels once into the display layout instead.
+    """
+    try:
+        return pygame.image.frombuffer(buffer, size, "BGRX")
+    except ValueError:
+        surface = pygame.image.frombuffer(buffer, size, "BGRA")
+    if pygame.display.get_surface() is not None:
+        return surface.convert()
+    opaque = pygame.Surface(size, 0, 32)
+    opaque.blit(surface, (0, 0))
+    return opaque
+
+
+class DiskPixelCache:
+    """
+    Stores scaled Surfaces as raw BGRA (BGRX when opaque) buffers on disk and maps them back.
+    Buffers are mapped copy-on-write, so drawing on a loaded Surface never touches the file.
+    """
+
+    # only images at least this big (in pixels) are worth a file of their own
+    MIN_PIXELS = 256 * 256
+
+    def __init__(self, directory=CACHE_DIR, min_pixels=MIN_PIXELS):
+        self.directory = directory
+        self.min_pixels = min_pixels
+        self._hashes = {}
+        self.hits = 0
+        self.misses = 0
+
+    def wants(self, size):
+        """Return True if an image scaled to `size` should go through the disk cache."""
+        return bool(size) and size[0] * size[1] >= self.min_pixels
+
+    def source_hash(self, path):
+        """Return the sha1 of the file at `path` (remembered while its mtime and size do not change)."""
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._hashes.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        with open(path, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        self._hashes[path] = (stamp, digest)
+        return digest
+
+    def file_path(self, path, size, opaque, tag=""):
+        """
+        Return the cache file used for `path` scaled to `size`.
+        tag: tells apart several buffers made from the same file at the same size (e.g. tiles)
+        """
+        fmt = "BGRX" if opaque else "BGRA"
+        tag = f"_{tag}" if tag else ""
+        return os.path.join(self.directory, f"{self.source_hash(path)}_{size[0]}x{size[1]}{tag}_{fmt}.raw")
+
+    def has(self, path, size, opaque=False, tag=""):
+        """Return True if `path` at `size` has been stored with this opacity."""
+        return os.path.exists(self.file_path(path, size, opaque, tag))
+
+    def load(self, path, size, opaque=False, tag=""):
+        """
+        Return the cached Surface for `path` at `size`, or None if it has not been stored yet.
+        opaque: when True the Surface has no per-pixel alpha (like convert()), otherwise it
+                keeps its alpha channel (like convert_alpha()).
+        """
+        cache_file = self.file_path(path, size, opaque, tag)
+        if not os.path.exists(cache_file) or os.path.getsize(cache_file) != size[0] * size[1] * 4:
+            self.misses += 1
+            return None
+        with open(cache_file, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        # the Surface keeps a reference to the mapping, so it stays valid after the file is closed
+        surface = map_opaque(buffer, size) if opaque else pygame.image.frombuffer(buffer, size, "BGRA")
+        self.hits += 1
+        return surface
+
+    def store(self, path, surface, opaque=False, tag=""):
+        """Write the pixels of `surface` (the scaled image of `path`) to the cache directory."""
+        size = surface.get_size()
+        if surface.get_bitsize() < 32 or surface.get_colorkey() is not None:
+            # palette / colorkey images are flattened to per-pixel alpha first
+            flat = pygame.Surface(size, pygame.SRCALPHA, 32)
+            flat.blit(surface, (0, 0))
+            surface = flat
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+        cache_file = self.file_path(path, size, opaque, tag)
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(pygame.image.tobytes(surface, "BGRA"))
+        os.replace(tmp_file, cache_file)
+
+    def clear(self):
+        """Delete every cached buffer. Returns the number of files removed."""
+        removed = 0
+        if os.path.exists(self.directory):
+            for filename in os.listdir(self.directory):
+                if filename.endswith(".raw") or filename.endswith(".tmp"):
+                    try:
+                        os.remove(os.path.join(self.directory, filename))
+                        removed += 1
+                    except OSError:
+                        # a mapped file cannot be removed on Windows; it is replaced next launch
+                        pass
+        self._hashes.clear()
+        return removed
+
+    def stats(self):
+        """Return a dict with the hit/miss counters."""
+        return {"hits": self.hits, "misses": self.misses}
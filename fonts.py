@@ -0,0 +1,59 @@
+"""
+date : 2026 january 20
+description : Process-wide font registry.
+pygame.font.SysFont searches the system fonts every time it is called. Screens and
+sprites ask this registry instead: each (name, size, bold, italic) is resolved once and
+the same Font object is handed to every caller for the rest of the session.
+"""
+import pygame
+
+
+class FontRegistry:
+    """
+    Caches Font objects keyed by (name, size, bold, italic).
+    Fonts are shared between every caller, so their bold / italic / underline state must
+    not be changed.
+    """
+
+    def __init__(self):
+        self._fonts = {}
+        self.lookups = 0
+        self.hits = 0
+
+    def get(self, name=None, size=24, bold=False, italic=False):
+        """
+        Return the shared Font, resolving it with SysFont only the first time.
+        name=None is pygame's default font, like SysFont(None, size).
+        """
+        self.lookups += 1
+        key = (name, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.SysFont(name, size, bold, italic)
+        self._fonts[key] = font
+        return font
+
+    def __len__(self):
+        """Number of live Font objects held by the registry."""
+        return len(self._fonts)
+
+    def clear(self):
+        """Drop every font (e.g. before pygame.font.quit())."""
+        self._fonts.clear()
+
+    def stats(self):
+        """Return a dict with the number of live fonts and the lookup / hit counters."""
+        return {"fonts": len(self._fonts), "lookups": self.lookups, "hits": self.hits}
+
+
+# shared registry used by the screens and sprites
+registry = FontRegistry()
+
+
+def get_font(name=None, size=24, bold=False, italic=False):
+    """Shortcut for registry.get(), see FontRegistry.get."""
+    return registry.get(name, size, bold, italic)
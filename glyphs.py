@@ -0,0 +1,127 @@
+"""
+date : 2026 january 20
+description : Glyph atlases for text drawn every frame.
+A GlyphAtlas renders the printable ASCII characters of one (font, colour) once into a
+single Surface. Strings are then composed with one batched blits() call taking glyphs out
+of the atlas, so HUD counters, the tutorial box and button labels never call font.render
+on the hot path. Recently drawn whole strings can also be kept, making a repeated string
+a single blit.
+"""
+from collections import OrderedDict
+import pygame
+
+# characters packed into the atlas up front; others are rendered on first use
+ATLAS_CHARS = "".join(chr(c) for c in range(32, 127))
+
+
+class GlyphAtlas:
+    """
+    Pre-rendered glyphs of `font` in `color`.
+    string_cache: number of recent whole strings kept as composed Surfaces (0 disables)
+    """
+
+    def __init__(self, font, color, antialias=True, string_cache=32):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        # rendered text is a little taller than get_height() for some fonts
+        self.height = max(font.get_height(), font.size(ATLAS_CHARS)[1])
+        self.string_cache = string_cache
+        self._strings = OrderedDict()
+        self._rects = {}
+        self._extra = {}
+        self._advance = {}
+        self.surface = self._build(ATLAS_CHARS)
+
+    def _render(self, char):
+        return self.font.render(char, self.antialias, self.color)
+
+    def _build(self, chars):
+        """Render `chars` side by side into one per-pixel alpha Surface and remember each glyph's rect."""
+        glyphs = [(char, self._render(char)) for char in chars]
+        width = sum(glyph.get_width() for _, glyph in glyphs)
+        atlas = pygame.Surface((max(1, width), self.height), pygame.SRCALPHA)
+        x = 0
+        for char, glyph in glyphs:
+            # MAX keeps the glyph's own colour and alpha on the transparent atlas
+            atlas.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self._rects[char] = pygame.Rect(x, 0, glyph.get_width(), glyph.get_height())
+            self._advance[char] = self._metrics_advance(char, glyph)
+            x += glyph.get_width()
+        return atlas.convert_alpha() if pygame.display.get_surface() else atlas
+
+    def _metrics_advance(self, char, glyph):
+        metrics = self.font.metrics(char)
+        if metrics and metrics[0] is not None:
+            return metrics[0][4]
+        return glyph.get_width()
+
+    def _extra_glyph(self, char):
+        glyph = self._extra.get(char)
+        if glyph is None:
+            glyph = self._render(char)
+            self._extra[char] = glyph
+            self._advance[char] = self._metrics_advance(char, glyph)
+        return glyph
+
+    def size(self, text):
+        """Return the (width, height) `text` takes, like Font.size."""
+        width = 0
+        for char in text:
+            if char not in self._advance:
+                self._extra_glyph(char)
+            width += self._advance[char]
+        return width, self.height
+
+    def _blits(self, text, x, y, flags=0):
+        """Return the blits() sequence drawing `text` with its top-left at (x, y)."""
+        sequence = []
+        for char in text:
+            rect = self._rects.get(char)
+            if rect is not None:
+                sequence.append((self.surface, (x, y), rect, flags))
+            else:
+                glyph = self._extra_glyph(char)
+                sequence.append((glyph, (x, y), glyph.get_rect(), flags))
+            x += self._advance[char]
+        return sequence
+
+    def render(self, text):
+        """Return `text` composed into its own Surface (kept in the recent-strings cache)."""
+        surface = self._strings.get(text)
+        if surface is not None:
+            self._strings.move_to_end(text)
+            return surface
+        surface = pygame.Surface(self.size(text), pygame.SRCALPHA)
+        surface.blits(self._blits(text, 0, 0, pygame.BLEND_RGBA_MAX), False)
+        if self.string_cache:
+            self._strings[text] = surface
+            if len(self._strings) > self.string_cache:
+                self._strings.popitem(last=False)
+        return surface
+
+    def draw(self, surface, text, pos):
+        """Draw `text` on `surface` with its top-left at `pos`; returns the rect drawn."""
+        if self.string_cache:
+            return surface.blit(self.render(text), pos)
+        surface.blits(self._blits(text, pos[0], pos[1]), False)
+        return pygame.Rect(pos, self.size(text))
+
+
+# one atlas per (font, colour)
+_atlases = {}
+
+
+def get_atlas(font, color, antialias=True):
+    """Return the shared GlyphAtlas of `font` in `color` (fonts come from fonts.get_font, so they live for the session)."""
+    key = (font, tuple(color), antialias)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(font, color, antialias)
+        _atlases[key] = atlas
+    return atlas
+
+
+def draw_text(surface, font, text, color, pos):
+    """Draw `text` through the atlas of (font, color); returns the rect drawn."""
+    return get_atlas(font, color).draw(surface, text, pos)
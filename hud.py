@@ -0,0 +1,96 @@
+"""
+date : 2026 january 20
+description : Retained, dirty-tracked heads-up display.
+Each HUD item is bound to a value (death count, health, reload seconds, ...). The item's
+text Surface is composed only when that value changes; drawing the HUD is then a few
+blits of retained Surfaces. The rects changed by the last update are kept in `dirty` so
+the frame can present only those regions.
+"""
+import assets
+import glyphs
+
+
+class HudItem:
+    """
+    One line of the HUD.
+    value: callable returning the bound value (compared with != to detect changes)
+    fmt: callable turning the value into the text shown, or None to hide the item
+    anchor: rect attribute placed at `pos` ('topleft', 'topright', ...)
+    """
+
+    def __init__(self, value, fmt, color, pos, anchor="topleft"):
+        self.value = value
+        self.fmt = fmt
+        self.color = color
+        self.pos = pos
+        self.anchor = anchor
+        self.last = object()
+        self.surface = None
+        self.rect = None
+
+
+class HUD:
+    """A set of named HudItems drawn with `font`."""
+
+    def __init__(self, font):
+        self.font = font
+        self.items = {}
+        self.dirty = []
+        self.redraws = 0
+
+    def add(self, name, value, fmt, color, pos, anchor="topleft"):
+        """Bind a new item; see HudItem."""
+        self.items[name] = HudItem(value, fmt, color, pos, anchor)
+
+    def update(self):
+        """
+        Re-compose the items whose bound value changed.
+        Their old and new rects become the `dirty` list (empty when nothing changed).
+        """
+        self.dirty = []
+        for item in self.items.values():
+            value = item.value()
+            if value == item.last:
+                continue
+            item.last = value
+            if item.rect is not None:
+                self.dirty.append(item.rect)
+            text = item.fmt(value)
+            if text:
+                item.surface = glyphs.get_atlas(self.font, item.color).render(text)
+                item.rect = item.surface.get_rect(**{item.anchor: item.pos})
+                self.dirty.append(item.rect)
+            else:
+                item.surface = None
+                item.rect = None
+            self.redraws += 1
+
+    def draw(self, surface):
+        """Blit every visible item; returns their rects."""
+        visible = [(item.surface, item.rect) for item in self.items.values() if item.surface is not None]
+        for item_surface, _ in visible:
+            assets.audit.check(item_surface, "HUD")
+        surface.blits(visible, False)
+        return [rect for _, rect in visible]
+
+    def invalidate(self):
+        """Force every item to be re-composed (and reported dirty) on the next update."""
+        for item in self.items.values():
+            item.last = object()
+
+
+def gameplay_hud(game, font):
+    """Build the HUD of the gameplay screen `game` (a main.Main): deaths, cooldown, reload countdown and health."""
+    width, height = game.size
+    hud = HUD(font)
+    hud.add("deaths", lambda: game.game_state.death_count if game.game_state else None,
+            lambda deaths: None if deaths is None else f"X {deaths}", (255, 255, 255), (10, 10))
+    hud.add("cooldown", lambda: hasattr(game.player, 'obsidian_blade') and game.player.obsidian_blade.cooldown > 0,
+            lambda active: "Ability Cooldown" if active else None, (255, 0, 0), (10, 40))
+    # seconds left, rounded up
+    hud.add("reload", lambda: int(game.reload_timer / 1000) + 1 if game.reload_timer > 0 else 0,
+            lambda seconds: f"Arrow Reloading: {seconds}s" if seconds else None, (255, 255, 0),
+            (width - 10, 10), anchor="topright")
+    hud.add("health", lambda: game.player.health,
+            lambda health: f"Health: {health}", (0, 255, 0), (10, height - 40))
+    return hud
@@ -7,10 +7,21 @@ It uses the pygame library for rendering and input handling, and relies on custo
 
 
 """
+import os
 import random
 import pygame
+import animation
+import assets
+import bundles
+import dirty_render
+import fonts
+import glyphs
+import hud
 import sprite
+import telemetry
+import viewport
 import surfacekeeper
+from json_loader import load_json
 
 class Main(surfacekeeper.ScreenManager):
     def __init__(self, app, level=1, game_state=None):
@@ -31,6 +42,9 @@ class Main(surfacekeeper.ScreenManager):
         self.clock = self.app.clock
         self.size = self.app.size
         self.won = False
+        #level background and boss stay loaded until this game screen ends
+        self.bundle = f"level{level}"
+        bundles.loader.acquire(self.bundle)
         #E - Entities
         self.entities()
         # Action requested by game loop after exit (used to request VN, restart, etc.)
@@ -43,40 +57,55 @@ class Main(surfacekeeper.ScreenManager):
         # Pause state
         self.paused = False
         # Font for UI
-        self.font = pygame.font.SysFont(None, 36)
+        self.font = fonts.get_font(None, 36)
+        # deaths / cooldown / reload / health overlay, re-composed only when a value changes
+        self.hud = hud.gameplay_hud(self, self.font)
+        # translucent layer and text of the pause menu, built on first pause
+        self.pause_overlay = None
+        self.pause_text = None
+        # while paused or dying the world is captured once into `frozen` (see draw_frozen)
+        self.frozen = None
+        self.frozen_above = []
+        self.frozen_state = None
+        self.frozen_tracker = dirty_render.SpriteTracker()
+        # with dirty-rect rendering, sprites / view as they were last drawn (see dirty_render.py)
+        self.tracker = dirty_render.SpriteTracker()
+        self.drawn_view = None
+        # only sprites on (or near) the screen are drawn
+        self.viewport = viewport.Viewport(self.size)
         self.weapon = 'basic'
+        # rotate/flip every weapon image once so attacks only look up ready frames
+        sprite.build_weapon_variants()
+        # prefetch the first lines of the story that can follow this level
+        if getattr(self, 'boss', None) is not None:
+            self.prefetch_story("boss_defeat")
+        if getattr(self, 'portal', None) is not None:
+            self.prefetch_story("portal")
         # Arrow limit variables
         self.arrow_count = 0
         self.max_arrows = random.randint(6, 12)
         self.reload_timer = 0  # in ms
 
+    def prefetch_story(self, story_part):
+        """Start decoding the first backgrounds / voice clips of a VisualNovel story."""
+        story_data = load_json(f"stories/{story_part}.json") or []
+        surfacekeeper.VisualNovel.prefetch_story(self.app, story_data)
+
     def entities(self):
         """
         This method initializes game entities, background music, and obstacles.
         It sets up the game environment based on the current level and game state.
         """
-        # play a random background music file (if available)
-        bgm_files = [
-            "src/Sounds/8bitsong.wav",
-            "src/Sounds/music1.mp3",
-            "src/Sounds/music2.mp3",
-            "src/Sounds/music3.mp3"
-        ]
-       
-       #adding background music
-        pygame.mixer.init()
-        self.bgm = random.choice(bgm_files)
-        self.music = pygame.mixer.music.load(self.bgm)
-        pygame.mixer.music.play(-1)
-        pygame.mixer.music.set_volume(0.2)
+        #background music is owned by the app and keeps streaming across respawns
+        self.app.music.play_for(f"level{self.level}")
+        #every sprite is replaced, so the next frame is redrawn whole
+        self.full_redraw = True
         
-        #load and scale background image
-        bg_name = "Battleground2.png" if self.level == 2 else "Battleground1.png"
-        background_image = pygame.image.load(f"src/Images/map/{bg_name}")
-        background_image = pygame.transform.scale(background_image, (10000, 600))
+        #tiled background image (shared per level, so respawns reuse the scaled tiles)
+        background_tiles = bundles.level_tiles(self.level)
         
         #Create background sprite for scrolling effect
-        self.background = sprite.Background(background_image, screen_width=1920)
+        self.background = sprite.Background(background_tiles, screen_width=1920)
 
         #create a player from sprite module so we can render it
         self.player = sprite.Player()
@@ -88,8 +117,8 @@ class Main(surfacekeeper.ScreenManager):
         self.player.ground_y = self.player.rect.bottom
 
         #group to hold all active sprites (player, blades, bullets, etc.)
+        #the background is updated and drawn on its own, before this group
         self.all_sprites = pygame.sprite.Group()
-        self.all_sprites.add(self.background)
         
         #obstacles live in world coordinates (move with background)
         self.obstacles = pygame.sprite.Group()
@@ -196,6 +225,9 @@ class Main(surfacekeeper.ScreenManager):
             # Update reload timer
             if self.reload_timer > 0:
                 self.reload_timer -= dt
+            # finish queued preloads a couple of ms at a time
+            self.app.warmup.step(2)
+            self.app.music.update(dt)
             #E - Event handling
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -206,6 +238,12 @@ class Main(surfacekeeper.ScreenManager):
                         self.keepGoing = False
                     elif event.key == pygame.K_p:
                         self.paused = not self.paused
+                    elif event.key == pygame.K_F9:
+                        #dump surface memory / asset load telemetry to the console
+                        print(telemetry.tracker.report(sprites=self.all_sprites))
+                        print(f"Fonts: {fonts.registry.stats()}")
+                        print(f"Frames: {self.app.renderer.stats()}")
+                        print(f"Sprites: {self.viewport.stats()}")
                     elif self.paused:
                         if event.key == pygame.K_r:
                             self.paused = False
@@ -278,6 +316,8 @@ class Main(surfacekeeper.ScreenManager):
                         self.player.init_move()
                         self.background.stop()
             self.handle_input(dt)
+        # leaving the level: unload its background/boss unless another screen uses them
+        bundles.loader.release(self.bundle)
 
     def handle_input(self, dt):
             """
@@ -304,7 +344,10 @@ class Main(surfacekeeper.ScreenManager):
             #update sprites depending on game state
             if not self.game_over and not self.paused:
                 #normal gameplay: update everything and check collisions
+                self.background.update(dt)
                 self.all_sprites.update(dt)
+                #advance enemy/boss/portal/fireball animations in one pass
+                animation.clock.tick(dt)
                 self.check_collision()
                 self.check_shield_collision()
             elif self.game_over:
@@ -331,51 +374,139 @@ class Main(surfacekeeper.ScreenManager):
                 self.background.stop()
                 self.background.update(0)
             #R - Refresh the display (draw current sprite states)
-            #draw all sprites (order is insertion order)
-            self.all_sprites.draw(self.screen)
-
-            # Draw death count
-            if self.game_state:
-                # skull image
-                skull_text = "X " + str(self.game_state.death_count)
-                death_surf = self.font.render(skull_text, True, (255, 255, 255))
-                self.screen.blit(death_surf, (10, 10))
+            # Update death count, ability cooldown, arrow reload countdown and health
+            self.hud.update()
+            if self.paused or self.game_over:
+                self.draw_frozen()
+                return
+            if self.frozen_state is not None:
+                #back from a pause: the world moves again
+                self.frozen = None
+                self.frozen_state = None
+                self.full_redraw = True
+            assets.audit.check_group(self.all_sprites)
+            self.visible = self.viewport.visible(self.all_sprites)
+            renderer = self.app.renderer
+            rects = None
+            if renderer.enabled:
+                #only what moved needs redrawing while the view stays the same
+                changed = self.tracker.changed(self.all_sprites) + self.hud.dirty
+                view = tuple(self.background.rect)
+                #a scaled world is upscaled whole, so it is never redrawn by parts
+                if view == self.drawn_view and not self.full_redraw and self.app.world is None:
+                    rects = dirty_render.merge(changed, bounds=self.viewport.rect)
+                    if not renderer.worth_partial(rects, self.size):
+                        rects = None
+                self.drawn_view = view
+                self.full_redraw = False
+            if rects is None:
+                self.draw_scene()
+            else:
+                for rect in rects:
+                    self.screen.set_clip(rect)
+                    self.draw_scene()
+                self.screen.set_clip(None)
+            renderer.present(rects)
 
-            # Draw ability cooldown
-            if hasattr(self.player, 'obsidian_blade') and self.player.obsidian_blade.cooldown > 0:
-                cooldown_text = "Ability Cooldown"
-                cooldown_surf = self.font.render(cooldown_text, True, (255, 0, 0))
-                self.screen.blit(cooldown_surf, (10, 40))
+    def draw_scene(self):
+        """
+        This method draws the level, the sprites and the HUD on the screen
+        (only inside the screen's clip rect when one is set).
+        """
+        #draw the sprites on screen (order is insertion order)
+        if self.app.world is None:
+            self.background.draw(self.screen)
+            self.viewport.draw(self.screen, self.visible)
+        else:
+            self.app.world.draw(self.screen, self.background, self.visible)
+        self.hud.draw(self.screen)
 
-            # Draw arrow reload countdown
-            if self.reload_timer > 0:
-                countdown_seconds = int(self.reload_timer / 1000) + 1  # round up
-                reload_text = f"Arrow Reloading: {countdown_seconds}s"
-                reload_surf = self.font.render(reload_text, True, (255, 255, 0))
-                # Top right
-                self.screen.blit(reload_surf, (self.size[0] - reload_surf.get_width() - 10, 10))
+    def draw_frozen(self):
+        """
+        This method draws a frame while paused or during the death animation.
+        Nothing but the dying player moves then, so the world is drawn once into `frozen` when
+        the pause / game over starts; each frame only redraws the player (under the sprites drawn
+        after it) and the HUD items that changed over it (the screen keeps the rest of the last frame).
+        """
+        #the death animation keeps playing even while paused
+        moving = [self.player] if self.game_over else []
+        state = (self.paused, self.game_over)
+        if state != self.frozen_state:
+            self.frozen_state = state
+            self.freeze(skip=self.player if self.game_over else None)
+            self.frozen_tracker.reset()
+            self.frozen_tracker.changed(moving)
+            self.screen.set_clip(None)
+            self.draw_frozen_scene()
+            self.app.renderer.present(None)
+            return
+        changed = self.hud.dirty + self.frozen_tracker.changed(moving)
+        rects = dirty_render.merge(changed, bounds=self.viewport.rect)
+        for rect in rects:
+            self.screen.set_clip(rect)
+            self.draw_frozen_scene()
+        self.screen.set_clip(None)
+        self.app.renderer.present(rects)
 
-            # Draw health on bottom left
-            health_text = f"Health: {self.player.health}"
-            health_surf = self.font.render(health_text, True, (0, 255, 0))
-            self.screen.blit(health_surf, (10, self.size[1] - 40))
+    def freeze(self, skip=None):
+        """
+        This method captures the background and the visible sprites drawn before `skip` into `frozen`.
+        The sprites drawn after `skip` are kept in `frozen_above`, to be blitted over it each frame.
+        """
+        if self.frozen is None:
+            self.frozen = pygame.Surface(self.size).convert()
+        below = self.viewport.visible(self.all_sprites)
+        above = []
+        if skip in below:
+            at = below.index(skip)
+            below, above = below[:at], below[at + 1:]
+        if self.app.world is None:
+            self.background.draw(self.frozen)
+            self.viewport.draw(self.frozen, below)
+        else:
+            self.app.world.draw(self.frozen, self.background, below)
+        self.frozen_above = [(spr.image, spr.rect.copy()) for spr in above]
 
-            # Draw pause menu
-            if self.paused:
-                # Semi-transparent overlay
-                overlay = pygame.Surface(self.size, pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 128))
-                self.screen.blit(overlay, (0, 0))
-                # Menu text
-                resume_text = self.font.render("Resume (R)", True, (255, 255, 255))
-                quit_text = self.font.render("Back to Menu (Q)", True, (255, 255, 255))
-                menu_title = self.font.render("Paused", True, (255, 255, 255))
-                self.screen.blit(menu_title, (self.size[0]//2 - menu_title.get_width()//2, self.size[1]//2 - 100))
-                self.screen.blit(resume_text, (self.size[0]//2 - resume_text.get_width()//2, self.size[1]//2 - 20))
-                self.screen.blit(quit_text, (self.size[0]//2 - quit_text.get_width()//2, self.size[1]//2 + 20))
+    def draw_frozen_scene(self):
+        """
+        This method draws the frozen world, the dying player (under the sprites that were drawn
+        after it), the HUD and the pause menu (only inside the screen's clip rect when one is set).
+        """
+        self.screen.blit(self.frozen, (0, 0))
+        if self.game_over:
+            clip = self.screen.get_clip()
+            pairs = [(self.player.image, self.player.rect)]
+            pairs += [pair for pair in self.frozen_above if clip.colliderect(pair[1])]
+            if self.app.world is None:
+                viewport.blit_pairs(self.screen, pairs)
+            else:
+                self.app.world.blit_pairs(self.screen, pairs)
+        self.hud.draw(self.screen)
+        if self.paused:
+            if self.pause_overlay is None:
+                self.build_pause_menu()
+            self.screen.blit(self.pause_overlay, (0, 0))
+            self.screen.blit(*self.pause_text)
 
-            pygame.display.flip()
-            
+    def build_pause_menu(self):
+        """
+        This method renders the pause menu once: a half-transparent black layer and its three lines of text.
+        """
+        # Semi-transparent overlay
+        self.pause_overlay = pygame.Surface(self.size).convert()
+        self.pause_overlay.fill((0, 0, 0))
+        self.pause_overlay.set_alpha(128)
+        # Menu text, composed into one transparent Surface
+        white = glyphs.get_atlas(self.font, (255, 255, 255))
+        lines = [(text, (self.size[0]//2 - white.size(text)[0]//2, self.size[1]//2 + y))
+                 for text, y in (("Paused", -100), ("Resume (R)", -20), ("Back to Menu (Q)", 20))]
+        area = pygame.Rect(lines[0][1], white.size(lines[0][0])).unionall(
+            [pygame.Rect(pos, white.size(text)) for text, pos in lines[1:]])
+        text_layer = pygame.Surface(area.size, pygame.SRCALPHA)
+        for text, (x, y) in lines:
+            # MAX keeps the glyphs' own colour and alpha on the transparent layer (lines never overlap)
+            text_layer.blit(white.render(text), (x - area.x, y - area.y), special_flags=pygame.BLEND_RGBA_MAX)
+        self.pause_text = (text_layer, area.topleft)
 
     def check_collision(self):
             """
@@ -549,5 +680,10 @@ class Main(surfacekeeper.ScreenManager):
 
 
 if __name__ == "__main__":
-    app = surfacekeeper.App(size=(1000, 600))
+    # MONSTER_DIRTY_RECTS=1 redraws and presents only the regions that change,
+    # MONSTER_RENDER_SCALE=0.5 draws the level at 500x300 and upscales it to the 1000x600 window,
+    # MONSTER_PRELOAD=1 decodes the sprite images on all cores at startup (see preload.py)
+    app = surfacekeeper.App(size=(1000, 600), preload_images=bool(os.environ.get("MONSTER_PRELOAD")),
+                            dirty_rects=bool(os.environ.get("MONSTER_DIRTY_RECTS")),
+                            render_scale=float(os.environ.get("MONSTER_RENDER_SCALE", 1)))
     app.run()
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""
+date : 2026 january 20
+description : Background music that lives for the whole session.
+The App owns one MusicManager. The current track keeps streaming across respawns; the
+next track is read into memory on a background thread, so switching never touches the
+disk on the game thread. A change of track fades the current one out and the next one
+in, driven by update(dt) so the game loop never waits. Tracks missing from disk are
+skipped.
+"""
+import io
+import os
+import random
+import threading
+import pygame
+
+TRACKS = [
+    "src/Sounds/8bitsong.wav",
+    "src/Sounds/music1.mp3",
+    "src/Sounds/music2.mp3",
+    "src/Sounds/music3.mp3",
+]
+
+
+class MusicManager:
+    """
+    Streams one track at a time through pygame.mixer.music.
+    SDL_mixer streams a single music track, so a crossfade is a fade-out of the current
+    stream followed by a fade-in of the next one; decoding whole tracks into Sounds to
+    overlap them would cost tens of MB and a long decode per track.
+    """
+
+    def __init__(self, tracks=TRACKS, volume=0.2, fade_ms=1200):
+        # Skip tracks that don't exist
+        self.tracks = [t for t in tracks if os.path.exists(t)]
+        self.volume = volume
+        self.fade_ms = fade_ms
+        self.current = None
+        self.next = None
+        self._data = {}
+        self._fade_left = 0
+        self._pending = None
+        self.scene = None
+
+    @property
+    def available(self):
+        return bool(self.tracks) and bool(pygame.mixer.get_init())
+
+    @property
+    def fading(self):
+        return self._pending is not None
+
+    def _read(self, track):
+        try:
+            with open(track, "rb") as f:
+                self._data[track] = f.read()
+        except OSError:
+            pass
+
+    def preload(self, track):
+        """Read `track` into memory on a background thread."""
+        if track is None or track in self._data:
+            return
+        threading.Thread(target=self._read, args=(track,), name="music-preload", daemon=True).start()
+
+    def _pick_next(self):
+        choices = [t for t in self.tracks if t != self.current] or self.tracks
+        self.next = random.choice(choices) if choices else None
+        self.preload(self.next)
+
+    def _start(self, track, fade_ms):
+        """Load `track` (from memory when preloaded) and start it fading in. Returns False if it cannot be played."""
+        data = self._data.get(track)
+        try:
+            if data is not None:
+                pygame.mixer.music.load(io.BytesIO(data), os.path.splitext(track)[1][1:])
+            else:
+                pygame.mixer.music.load(track)
+            pygame.mixer.music.set_volume(self.volume)
+            pygame.mixer.music.play(0, fade_ms=fade_ms)
+        except pygame.error:
+            # broken or unsupported file: never try it again
+            if track in self.tracks:
+                self.tracks.remove(track)
+            self._data.pop(track, None)
+            return False
+        # only the playing track and the next one are kept in memory
+        for old in [t for t in list(self._data) if t not in (track, self.next)]:
+            del self._data[old]
+        self.current = track
+        self._pick_next()
+        return True
+
+    def play(self, track=None):
+        """Start `track` (default a random one) unless music is already playing. Safe to call on every respawn."""
+        if not self.available or pygame.mixer.music.get_busy() or self.fading:
+            return
+        candidates = [track] if track in self.tracks else list(self.tracks)
+        random.shuffle(candidates)
+        for candidate in candidates:
+            if self._start(candidate, self.fade_ms):
+                return
+
+    def play_for(self, scene):
+        """
+        Keep the music going for `scene` (e.g. 'level1'): start it if nothing plays, and
+        crossfade to the next track when the scene differs from the previous one.
+        """
+        if self.scene is not None and scene != self.scene:
+            self.crossfade()
+        else:
+            self.play()
+        self.scene = scene
+
+    def crossfade(self, track=None):
+        """Fade the current track out and `track` (default the preloaded next one) in."""
+        if not self.available:
+            return
+        if track is None:
+            track = self.next
+        if self.current is None or not pygame.mixer.music.get_busy():
+            self.play(track)
+            return
+        self.preload(track)
+        self._pending = track
+        self._fade_left = self.fade_ms
+
+    def update(self, dt):
+        """Advance a fade and start the next track when the current one has ended (call once per frame)."""
+        if not self.available:
+            return
+        if self._pending is not None:
+            self._fade_left -= dt
+            if self._fade_left > 0:
+                pygame.mixer.music.set_volume(self.volume * self._fade_left / self.fade_ms)
+                return
+            track, self._pending = self._pending, None
+            if not self._start(track, self.fade_ms):
+                self.play()
+        elif self.current is not None and not pygame.mixer.music.get_busy():
+            # the track ended: go on with the preloaded one
+            if self.next is None or not self._start(self.next, self.fade_ms):
+                self.play()
+
+    def stop(self, fade_ms=0):
+        """Stop the music (fading out over `fade_ms`)."""
+        self._pending = None
+        self.current = None
+        if pygame.mixer.get_init():
+            if fade_ms:
+                pygame.mixer.music.fadeout(fade_ms)
+            else:
+                pygame.mixer.music.stop()
@@ -0,0 +1,149 @@
+"""
+date : 2026 january 20
+description : Parallel image decoding at startup.
+The sprite images the asset cache builds from a raw decode (see startup_paths) are decoded
+in a process pool using all cores. Workers send back raw RGBA pixels and the main process
+wraps them in Surfaces and seeds the shared asset cache, so spawning sprites never decodes
+on the main thread. Big images (backgrounds, slides, logos) are not preloaded: their
+consumers decode, scale and drop them on their own, so a raw copy would only sit in memory.
+Run `python preload.py` to compare the parallel wall time with a serial decode.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pygame
+import assets
+import bundles
+from atlas import atlas
+
+# bundles whose images are worth decoding before the first screen
+STARTUP_BUNDLES = ("gameplay", "level1", "level2")
+# image files (bytes) below which a serial decode is faster than starting a process pool
+MIN_POOL_BYTES = 32 * 1024 * 1024
+
+
+def startup_paths(names=STARTUP_BUNDLES, cache=None):
+    """
+    Return the images of bundles `names` that the asset cache scales from a raw decode,
+    biggest files first. Images served by the atlas or by the disk cache are left out.
+    """
+    if cache is None:
+        cache = assets.cache
+    paths = set()
+    for name in names:
+        for spec in bundles.get_manifest(name):
+            if spec[0] != "image":
+                continue
+            path, size = cache.normalize_path(spec[1]), spec[2]
+            if cache.disk is not None and cache.disk.wants(size):
+                continue
+            if path not in atlas and os.path.exists(path):
+                paths.add(path)
+    # big files first so no worker is left with a huge image at the end
+    return sorted(paths, key=lambda p: (-os.path.getsize(p), p))
+
+
+def worth_preloading(paths):
+    """
+    True when decoding `paths` on a process pool beats decoding them lazily: there is more
+    than one core and enough image data to pay for starting the workers (each one imports
+    pygame, and the whole game on platforms that spawn them).
+    """
+    if (os.cpu_count() or 1) < 2:
+        return False
+    return sum(os.path.getsize(p) for p in paths) >= MIN_POOL_BYTES
+
+
+def _decode(path):
+    """
+    Worker: decode one image and return (path, size, RGBA pixels, seconds spent).
+    Palette / colorkey images are flattened so transparency survives the trip as alpha.
+    """
+    start = time.perf_counter()
+    image = pygame.image.load(path)
+    if image.get_bitsize() < 32 or image.get_colorkey() is not None:
+        flat = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+        flat.blit(image, (0, 0))
+        image = flat
+    # a bytearray unpickles as a writable buffer, so the main process can wrap it without copying
+    pixels = bytearray(pygame.image.tobytes(image, "RGBA"))
+    return path, image.get_size(), pixels, time.perf_counter() - start
+
+
+def _to_surface(size, pixels):
+    return pygame.image.frombuffer(pixels, size, "RGBA")
+
+
+def decode_serial(paths):
+    """Decode `paths` one after another in this process (for timing; nothing is kept). Returns the count."""
+    for path in paths:
+        _decode(path)
+    return len(paths)
+
+
+def decode_parallel(paths, workers=None):
+    """
+    Decode `paths` in a process pool.
+    Returns ({path: Surface}, summed decode seconds of all workers).
+    Decodes in this process when only one worker is available or worker processes
+    cannot be started.
+    """
+    surfaces = {}
+    cpu_seconds = 0.0
+    workers = workers or os.cpu_count() or 1
+    # keep the pygame banner out of every worker's output
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_decode, p) for p in paths]
+                for future in as_completed(futures):
+                    path, size, pixels, seconds = future.result()
+                    surfaces[path] = _to_surface(size, pixels)
+                    cpu_seconds += seconds
+        except (OSError, RuntimeError):
+            # no multiprocessing available (sandboxed / frozen build)
+            pass
+    # one core, or the pool could not run: decode whatever is left here
+    for path in paths:
+        if path not in surfaces:
+            path, size, pixels, seconds = _decode(path)
+            surfaces[path] = _to_surface(size, pixels)
+            cpu_seconds += seconds
+    return surfaces, cpu_seconds
+
+
+def preload_images(paths=None, workers=None, cache=None):
+    """
+    Decode the startup image set in parallel and seed the asset cache with it.
+    Returns a report dict: images, workers, wall time and the summed per-image decode
+    time (what a serial decode would have cost).
+    """
+    if paths is None:
+        paths = startup_paths()
+    if cache is None:
+        cache = assets.cache
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    surfaces, cpu_seconds = decode_parallel(paths, workers)
+    for path, surface in surfaces.items():
+        cache.store_raw(path, surface)
+    wall = time.perf_counter() - start
+    return {"images": len(surfaces), "workers": workers, "wall_seconds": wall, "decode_seconds": cpu_seconds}
+
+
+def format_report(report):
+    """Return a one-line summary of a preload_images() report."""
+    speedup = report["decode_seconds"] / report["wall_seconds"] if report["wall_seconds"] else 0
+    return (f"Decoded {report['images']} images on {report['workers']} workers in "
+            f"{report['wall_seconds']:.2f}s (serial decode time {report['decode_seconds']:.2f}s, x{speedup:.1f})")
+
+
+if __name__ == "__main__":
+    paths = startup_paths()
+    start = time.perf_counter()
+    decode_serial(paths)
+    serial = time.perf_counter() - start
+    print(f"Serial: {len(paths)} images in {serial:.2f}s")
+    report = preload_images(paths)
+    print("Parallel: " + format_report(report))
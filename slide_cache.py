@@ -0,0 +1,168 @@
+"""
+date : 2026 january 20
+description : Lazily decoded, LRU-bounded slide images and story clips.
+Slide decks (the Introduction screen, the VisualNovel backgrounds) decode a slide only
+when it is shown. The slides (and voice clips) coming next are decoded on a background
+thread, and everything decoded goes into a small LRU, so showing the next one only swaps
+a reference and memory stays bounded however long the deck is.
+"""
+import queue
+import threading
+import time
+from collections import OrderedDict
+import pygame
+import assets
+
+
+class PrefetchCache:
+    """
+    LRU of up to `capacity` decoded files with a prefetch thread.
+    Subclasses define _decode(path), run on the prefetch thread (or on the main thread
+    when a file is needed before it was prefetched), and may define _finish(), run on
+    the main thread the first time the file is used.
+    """
+
+    def __init__(self, capacity=4):
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._thread = None
+        self.missing = set()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, path):
+        return path in self._entries
+
+    def _decode(self, path):
+        """Return (value, decode seconds, scale seconds) for `path`."""
+        raise NotImplementedError
+
+    def _finish(self, path, value, decode, scale):
+        """Return the value handed out for `path` (main thread, once per decode)."""
+        return value
+
+    def _put(self, path, entry):
+        # caller holds the lock
+        self._entries[path] = entry
+        self._entries.move_to_end(path)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def _worker(self):
+        while True:
+            path = self._queue.get()
+            try:
+                value, decode, scale = self._decode(path)
+                entry = (value, False, decode, scale)
+            except (pygame.error, OSError):
+                entry = None
+            with self._lock:
+                event = self._pending.pop(path, None)
+                if entry is None:
+                    self.missing.add(path)
+                elif path not in self._entries:
+                    self._put(path, entry)
+            if event is not None:
+                event.set()
+
+    def prefetch(self, paths):
+        """Decode `paths` in the background if they are not cached, queued or known to be missing."""
+        for path in paths:
+            with self._lock:
+                if path in self._entries or path in self._pending or path in self.missing:
+                    continue
+                self._pending[path] = threading.Event()
+            self._queue.put(path)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name=f"{type(self).__name__}-prefetch", daemon=True)
+            self._thread.start()
+
+    def get(self, path):
+        """
+        Return the decoded file `path`, decoding it now if the prefetch thread has not done
+        it (waits for it instead when it is decoding that file right now).
+        Raises pygame.error / OSError for a missing or broken file.
+        """
+        with self._lock:
+            event = self._pending.get(path)
+        if event is not None:
+            event.wait()
+        with self._lock:
+            if path in self.missing:
+                raise FileNotFoundError(path)
+            entry = self._entries.get(path)
+            if entry is not None:
+                self._entries.move_to_end(path)
+        if entry is None:
+            self.misses += 1
+            try:
+                value, decode, scale = self._decode(path)
+            except (pygame.error, OSError):
+                with self._lock:
+                    self.missing.add(path)
+                raise
+            entry = (value, False, decode, scale)
+        else:
+            self.hits += 1
+        value, finished, decode, scale = entry
+        if not finished:
+            value = self._finish(path, value, decode, scale)
+            with self._lock:
+                self._put(path, (value, True, 0.0, 0.0))
+        return value
+
+    def clear(self):
+        """Forget every cached file."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SlideCache(PrefetchCache):
+    """
+    Slides scaled to `size`.
+    The prefetch thread only decodes and scales; the conversion to the display format
+    happens on the main thread the first time a slide is shown.
+    """
+
+    def __init__(self, size, capacity=4):
+        super().__init__(capacity)
+        self.size = tuple(size)
+
+    def _decode(self, path):
+        start = time.perf_counter()
+        image = pygame.image.load(path)
+        decoded = time.perf_counter()
+        image = pygame.transform.scale(image, self.size)
+        return image, decoded - start, time.perf_counter() - decoded
+
+    def _finish(self, path, image, decode, scale):
+        start = time.perf_counter()
+        image = image.convert()
+        scale += time.perf_counter() - start
+        if assets.cache.telemetry is not None:
+            assets.cache.telemetry.record(path, image, decode, scale)
+        return image
+
+
+class ClipCache(PrefetchCache):
+    """Decoded mixer Sounds (voice clips and effects of a story)."""
+
+    def _decode(self, path):
+        start = time.perf_counter()
+        sound = pygame.mixer.Sound(path)
+        return sound, time.perf_counter() - start, 0.0
+
+    def _finish(self, path, sound, decode, scale):
+        if assets.cache.telemetry is not None:
+            assets.cache.telemetry.record_sound(path, sound, decode)
+        return sound
+
+
+# slides of the Introduction screen, shared by every ShowIntro
+intro_slides = SlideCache((800, 450), capacity=4)
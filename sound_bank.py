@@ -0,0 +1,135 @@
+"""
+date : 2026 january 20
+description : Sound effect bank with a reserved channel pool.
+Every effect is decoded once and played on one of a fixed set of mixer channels reserved
+for the bank, so playing an effect never decodes a file or creates a channel. Each sound
+has a priority: when every channel is busy the lowest-priority (then oldest) voice is
+stolen, and a sound is dropped only when everything playing is more important than it.
+"""
+import pygame
+import assets
+
+# priorities, higher wins when the pool is full
+AMBIENT = 0
+EFFECT = 1
+IMPORTANT = 2
+VOICE = 3
+
+# name: (file, priority, volume)
+EFFECTS = {
+    "jump": ("src/Sounds/jump.wav", EFFECT, 0.3),
+    "die": ("src/Sounds/die.wav", IMPORTANT, 1.0),
+    "explosion": ("src/Sounds/explosion.wav", EFFECT, 0.8),
+}
+
+
+class SoundBank:
+    """
+    Named effects played on `channels` reserved mixer channels.
+    Does nothing (play() returns None) when no audio device is available.
+    """
+
+    def __init__(self, channels=8):
+        self.size = channels
+        self.channels = []
+        self._voices = {}
+        self._effects = {}
+        self.missing = set()
+        self._clock = 0
+        self.played = 0
+        self.stolen = 0
+        self.dropped = 0
+
+    def init(self):
+        """Reserve the channel pool (once the mixer is initialized). Returns False without audio."""
+        if self.channels:
+            return True
+        if not pygame.mixer.get_init():
+            return False
+        # the pool comes on top of the existing channels, which stay free for plain Sound.play()
+        pygame.mixer.set_num_channels(pygame.mixer.get_num_channels() + self.size)
+        # reserved channels (the first `size` ones) are never picked by Sound.play(), only by the bank
+        pygame.mixer.set_reserved(self.size)
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.size)]
+        return True
+
+    def register(self, name, path, priority=EFFECT, volume=1.0):
+        """Decode `path` once and make it playable as `name`."""
+        sound = assets.load_sound(path)
+        sound.set_volume(volume)
+        self._effects[name] = (sound, priority)
+
+    def load_effects(self, effects=None):
+        """Register every effect of `effects` (default EFFECTS) that can be decoded; returns the names that failed."""
+        failed = []
+        if not self.init():
+            return list((effects or EFFECTS).keys())
+        for name, (path, priority, volume) in (effects or EFFECTS).items():
+            if name in self._effects or name in self.missing:
+                continue
+            try:
+                self.register(name, path, priority, volume)
+            except (pygame.error, OSError):
+                # not retried, a missing effect just stays silent
+                self.missing.add(name)
+                failed.append(name)
+        return failed
+
+    def _channel_for(self, priority):
+        """Return a free channel, or the voice to steal for a sound of `priority`, or None."""
+        victim = None
+        for channel in self.channels:
+            if not channel.get_busy():
+                return channel
+            current = self._voices.get(channel, (AMBIENT, 0))
+            if victim is None or current < self._voices.get(victim, (AMBIENT, 0)):
+                victim = channel
+        if victim is not None and self._voices.get(victim, (AMBIENT, 0))[0] <= priority:
+            self.stolen += 1
+            return victim
+        return None
+
+    def play_sound(self, sound, priority=EFFECT, loops=0):
+        """Play `sound` on the pool; returns the Channel used or None if it was dropped."""
+        if not self.init():
+            return None
+        channel = self._channel_for(priority)
+        if channel is None:
+            self.dropped += 1
+            return None
+        self._clock += 1
+        self._voices[channel] = (priority, self._clock)
+        channel.play(sound, loops)
+        self.played += 1
+        return channel
+
+    def play(self, name, priority=None):
+        """Play the registered effect `name` (loading the default effects on first use)."""
+        effect = self._effects.get(name)
+        if effect is None:
+            if name not in self.missing:
+                self.load_effects()
+            effect = self._effects.get(name)
+            if effect is None:
+                return None
+        sound, default_priority = effect
+        return self.play_sound(sound, default_priority if priority is None else priority)
+
+    def stop(self):
+        """Stop every voice of the pool."""
+        for channel in self.channels:
+            channel.stop()
+
+    def stats(self):
+        """Return a dict with the played / stolen / dropped counters and the busy channels."""
+        busy = sum(1 for channel in self.channels if channel.get_busy())
+        return {"played": self.played, "stolen": self.stolen, "dropped": self.dropped, "busy": busy}
+
+
+# shared bank used by the sprites and the screens
+bank = SoundBank()
+
+
+def play(name, priority=None):
+    """Shortcut for bank.play(), see SoundBank.play."""
+    return bank.play(name, priority)
@@ -1,5 +1,11 @@
 import pygame
 import random
+import assets
+import animation
+import background_tiles
+import fonts
+import glyphs
+import sound_bank
 """
 This module defines the sprite classes for the game, including Player, Background, Enemy, Boss, and various projectile types.
 It handles player animations, enemy behaviors, projectile mechanics, and background movement.
@@ -11,6 +17,28 @@ class Player(pygame.sprite.Sprite):
     Player is not really moving, instead it's the backgound moving. 
     player only moves when the background reach the edge
     """
+    SIZE = (60, 100)
+    # animation name -> frame files (all scaled to SIZE)
+    FRAME_FILES = {
+        'stand': ["src/Images/player_animation/frame_03_delay-0.08s.gif"],
+        'move_l': [
+            "src/Images/player_animation/frame_40_delay-0.08s.gif",
+            "src/Images/player_animation/frame_41_delay-0.08s.gif",
+        ],
+        'move_r': [
+            "src/Images/player_animation/frame_14_delay-0.08s.gif",
+            "src/Images/player_animation/frame_15_delay-0.08s.gif",
+        ],
+        'jump': ["src/Images/player_animation/frame_jump_delay-0.08s.gif"],
+        'die': [
+            "src/Images/player_animation/death1.gif",
+            "src/Images/player_animation/death2.gif",
+            "src/Images/player_animation/death3.gif",
+        ],
+        'damaged_front': ["src/Images/player_animation/damaged_front.png"],
+        'damaged_left': ["src/Images/player_animation/damaged_left.png"],
+        'damaged_right': ["src/Images/player_animation/damaged_right.png"],
+    }
 
     def __init__(self):
         """
@@ -18,60 +46,29 @@ class Player(pygame.sprite.Sprite):
         
         """
         pygame.sprite.Sprite.__init__(self)
-        #setting sound effect for player
-        self.die_sound = pygame.mixer.Sound("src/Sounds/die.wav")
-        self.jump_sound = pygame.mixer.Sound("src/Sounds/jump.wav")
-        self.jump_sound.set_volume(0.3)
+        #sound effects (jump / die) are played through the shared sound bank
 
         #images of different actions
-        # Use simple Surfaces so code can run without external image files
-        # load animation frames (some are lists of frames)
-        self.stand = [pygame.image.load("src/Images/player_animation/frame_03_delay-0.08s.gif")]
-
-        self.move_l = [
-            pygame.image.load("src/Images/player_animation/frame_40_delay-0.08s.gif"),
-            pygame.image.load("src/Images/player_animation/frame_41_delay-0.08s.gif"),
-        ]
-
-        self.move_r = [
-            pygame.image.load("src/Images/player_animation/frame_14_delay-0.08s.gif"),
-            pygame.image.load("src/Images/player_animation/frame_15_delay-0.08s.gif"),
-        ]
+        # load animation frames (some are lists of frames), already scaled to the
+        # player's size (60x100) by the shared asset cache
+        self.stand = assets.load_frames(self.FRAME_FILES['stand'], self.SIZE)
+        self.move_l = assets.load_frames(self.FRAME_FILES['move_l'], self.SIZE)
+        self.move_r = assets.load_frames(self.FRAME_FILES['move_r'], self.SIZE)
 
         # single-frame surfaces for jump/attack/die (wrap as lists for uniform handling)
-        jump_surf = pygame.image.load("src/Images/player_animation/frame_jump_delay-0.08s.gif")
-        
+        self.jump = assets.load_frames(self.FRAME_FILES['jump'], self.SIZE)
+
+        # attack uses a slightly different size
         attack_surf = pygame.Surface((60, 40))
         attack_surf.fill((255, 128, 0))
-        self.die = [pygame.image.load("src/Images/player_animation/death1.gif"),
-                    pygame.image.load("src/Images/player_animation/death2.gif"),
-                    pygame.image.load("src/Images/player_animation/death3.gif"),
-            ]
-
-        # Load damaged animations
-        self.damaged_front = [pygame.image.load("src/Images/player_animation/damaged_front.png")]
-        self.damaged_left = [pygame.image.load("src/Images/player_animation/damaged_left.png")]
-        self.damaged_right = [pygame.image.load("src/Images/player_animation/damaged_right.png")]
-
-        self.jump = [jump_surf]
         self.attack_img = [attack_surf]
 
-        # scale all loaded frames to the player's size (60x100)
-        def _scale_list(frames, size=(60, 100)):
-            return [pygame.transform.scale(f, size) for f in frames]
+        self.die = assets.load_frames(self.FRAME_FILES['die'], self.SIZE)
 
-        # scale all animations
-        self.stand = _scale_list(self.stand)
-        self.move_l = _scale_list(self.move_l)
-        self.move_r = _scale_list(self.move_r)
-        self.jump = _scale_list(self.jump)
-        # attack uses a slightly different size
-        self.attack_img = _scale_list(self.attack_img, (60, 40))
-        self.die = _scale_list(self.die)
-        # Scale damaged animations to match player size (60x100)
-        self.damaged_front = _scale_list(self.damaged_front)
-        self.damaged_left = _scale_list(self.damaged_left)
-        self.damaged_right = _scale_list(self.damaged_right)
+        # Load damaged animations
+        self.damaged_front = assets.load_frames(self.FRAME_FILES['damaged_front'], self.SIZE)
+        self.damaged_left = assets.load_frames(self.FRAME_FILES['damaged_left'], self.SIZE)
+        self.damaged_right = assets.load_frames(self.FRAME_FILES['damaged_right'], self.SIZE)
 
         # animation mapping and runtime state
         self.animations = {
@@ -153,7 +150,7 @@ class Player(pygame.sprite.Sprite):
         if not self.on_ground:
             return
         # switch to jump animation
-        self.jump_sound.play()
+        sound_bank.play("jump")
 
         self.set_animation('jump')
         # initiate jump: negative vy moves up
@@ -168,7 +165,7 @@ class Player(pygame.sprite.Sprite):
         """
         Player the death animation and sound.
         """
-        self.die_sound.play()
+        sound_bank.play("die")
         self.set_animation('die')
         # don't kill the sprite here; animation/state can handle further logic
         # Stop damaged animation when dying
@@ -314,19 +311,17 @@ class DamagedPlayer(pygame.sprite.Sprite):
         self.duration = duration  # 1 second
         
         # Load the damaged player image based on facing direction
+        # Scaled to player size by the asset cache
         try:
             if player.facing == 'right':
-                self.image = pygame.image.load("src/Images/player_animation/frame_03_delay-0.08s.gif")
+                self.image = assets.load_image("src/Images/player_animation/frame_03_delay-0.08s.gif", (60, 100))
             else:  # facing left
-                self.image = pygame.image.load("src/Images/player_animation/frame_03_delay-0.08s.gif")
+                self.image = assets.load_image("src/Images/player_animation/frame_03_delay-0.08s.gif", (60, 100))
                 self.image = pygame.transform.flip(self.image, True, False)
         except Exception:
             # Fallback: create a red overlay
             self.image = pygame.Surface((60, 100))
             self.image.fill((255, 0, 0))
-        
-        # Scale to player size
-        self.image = pygame.transform.scale(self.image, (60, 100))
         self.rect = self.image.get_rect(center=player.rect.center)
     
     def update(self, dt):
@@ -343,18 +338,21 @@ class DamagedPlayer(pygame.sprite.Sprite):
 class Background(pygame.sprite.Sprite):
     """Represents the scrolling background in the game. The background moves left/right in response to player movement,
     and enforces boundaries to prevent scrolling beyond the level limits.
+    It is drawn tile by tile with draw(), only where it overlaps the screen.
     """
-    def __init__(self, image, screen_width=1920):
+    def __init__(self, tiles, screen_width=1920):
         """
-        This method initializes the Background sprite with the given image and screen width.
-        image: pygame.Surface representing the background image
+        This method initializes the Background sprite with the given tiled image and screen width.
+        tiles: background_tiles.TiledBackground holding the level image
         screen_width: width of the game screen in pixels
         """
         super().__init__()
 
-        #background, get from the parameter from main
-        self.image = image
-        self.rect = self.image.get_rect()
+        #background, get from the parameter from main; rect spans the whole level
+        self.tiles = tiles
+        self.world_width = tiles.world_width
+        self.world_height = tiles.world_height
+        self.rect = pygame.Rect(0, 0, self.world_width, self.world_height)
         
         #speed
         self.dx = 0
@@ -362,7 +360,7 @@ class Background(pygame.sprite.Sprite):
         
         # Screen and boundary info
         self.screen_width = screen_width
-        self.image_width = image.get_width()
+        self.image_width = self.world_width
         # Left boundary is 0, right boundary is when image right edge meets screen right edge
         self.min_x = -(self.image_width - self.screen_width)  # negative value
         self.max_x = 0
@@ -406,51 +404,43 @@ class Background(pygame.sprite.Sprite):
         
         self.rect.y += self.dy
 
+    def draw(self, surface):
+        """Blit the visible tiles of the level onto `surface`."""
+        self.tiles.draw(surface, self.rect.x, self.rect.y)
+
 
 class Enemy(pygame.sprite.Sprite):
     """
     This class represents a basic enemy that spawns in the game world.
     Enemies can chase the player when within a certain radius and require a set number of hits to be defeated.
     """
+    FRAMES_ROOT = ["src/Images/enemy/root/Root_monster_frame0.gif", "src/Images/enemy/root/Root_monster_frame1.gif"]
+    FRAMES_BAT = ["src/Images/enemy/bat/monster_bat1.gif", "src/Images/enemy/bat/monster_bat2.gif"]
+    FRAMES_TREE = ["src/Images/enemy/tree/monster_tree1.gif", "src/Images/enemy/tree/monster_tree2.gif"]
+
     def __init__(self, player, background, screen_width=1920, hard_mode=False):
         super().__init__()
         self.player = player
         self.background = background
         self.screen_width = screen_width
 
-        # Load and setup enemy image (no boss frames)
-        self.frames_root = [
-            pygame.image.load("src/Images/enemy/root/Root_monster_frame0.gif").convert_alpha(),
-            pygame.image.load("src/Images/enemy/root/Root_monster_frame1.gif").convert_alpha(),
-        ]
-        self.frames_bat = [
-            pygame.image.load("src/Images/enemy/bat/monster_bat1.gif").convert_alpha(),
-            pygame.image.load("src/Images/enemy/bat/monster_bat2.gif").convert_alpha(),
-        ]
-
-        self.frames_tree = [
-            pygame.image.load("src/Images/enemy/tree/monster_tree1.gif").convert_alpha(),
-            pygame.image.load("src/Images/enemy/tree/monster_tree2.gif").convert_alpha(),
-
-        ]
-        
-
         # Only regular enemy types (0=root, 1=bat, 2=tree)
+        # only the frames of the chosen type are loaded, pre-scaled once and shared by all enemies
         self.enemy_type = random.randint(0, 2)
 
         if self.enemy_type == 0:
-            self.frames = self.frames_root
             self.size = (60, 60)
+            self.clip = animation.get_clip(self.FRAMES_ROOT, self.size, 500, convert="alpha")
             self.health = 50
             self.damage = 25
         elif self.enemy_type == 1:
-            self.frames = self.frames_bat
             self.size = (30, 30)
+            self.clip = animation.get_clip(self.FRAMES_BAT, self.size, 500, convert="alpha")
             self.health = 25
             self.damage = 10
         elif self.enemy_type == 2:
-            self.frames = self.frames_tree
             self.size = (80, 80)
+            self.clip = animation.get_clip(self.FRAMES_TREE, self.size, 500, convert="alpha")
             self.health = 100
             self.damage = 50
 
@@ -460,16 +450,13 @@ class Enemy(pygame.sprite.Sprite):
         self.hit_cooldown = 0  # ms cooldown between hits
 
 
-        # frame timing
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.frame_duration = 500
-
-        self.image = pygame.transform.scale(self.frames[self.frame_index], self.size)
+        # frame timing is driven by the shared animation clock
+        self.frames = self.clip.frames
+        animation.clock.add(self, self.clip)
 
         # World spawn range
         enemy_w = self.image.get_width()
-        bg_w = max(1, self.background.image.get_width())
+        bg_w = max(1, self.background.world_width)
         max_x = max(0, bg_w - enemy_w)
 
         # compute player's world x (screen x - background offset)
@@ -515,20 +502,9 @@ class Enemy(pygame.sprite.Sprite):
 
 
     def update(self, dt=0):
-        self.frame_timer += dt
+        # animation frames are advanced by animation.clock
         self.hit_cooldown = max(0, self.hit_cooldown - dt)
 
-        if self.frame_timer >= self.frame_duration:
-            self.frame_timer = 0
-            self.frame_index += 1
-
-            if self.frame_index >= len(self.frames):
-                self.frame_index = 0
-
-            self.image = pygame.transform.scale(self.frames[self.frame_index], self.size)
-            old_center = self.rect.center
-            self.rect = self.image.get_rect(center=old_center)
-            
         try:
             # Regular enemies can chase
             if self.enemy_type != 2:
@@ -569,6 +545,9 @@ class Boss(pygame.sprite.Sprite):
     Optional `all_sprites` group can be provided so the boss will add projectiles there.
     Boss must be hit `required_hits` times by blade/bullet to die (not instant).
     """
+    FRAMES = ["src/Images/enemy/corc_boss/enemy_boss.gif", "src/Images/enemy/corc_boss/enemy_boss2.gif"]
+    SIZE = (500, 220)
+
     def __init__(self, player, background, screen_width=1920, all_sprites=None, hard_mode=False):
         super().__init__()
         self.player = player
@@ -578,26 +557,21 @@ class Boss(pygame.sprite.Sprite):
 
         # load boss frames (safe loads; if missing, create placeholder)
         try:
-            self.frames = [
-                pygame.image.load("src/Images/enemy/corc_boss/enemy_boss.gif").convert_alpha(),
-                pygame.image.load("src/Images/enemy/corc_boss/enemy_boss2.gif").convert_alpha(),
-            ]
+            self.clip = animation.get_clip(self.FRAMES, self.SIZE, 400, convert="alpha")
         except Exception:
             # fallback: two colored surfaces
-            f1 = pygame.Surface((200, 600), pygame.SRCALPHA); f1.fill((150, 30, 30))
-            f2 = pygame.Surface((200, 600), pygame.SRCALPHA); f2.fill((180, 60, 60))
-            self.frames = [f1, f2]
+            f1 = pygame.Surface((500, 220), pygame.SRCALPHA); f1.fill((150, 30, 30))
+            f2 = pygame.Surface((500, 220), pygame.SRCALPHA); f2.fill((180, 60, 60))
+            self.clip = animation.AnimationClip([f1, f2], 400)
 
         # boss is larger
         self.size = (500, 220)
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.frame_duration = 400
-        self.image = pygame.transform.scale(self.frames[self.frame_index], self.size)
+        self.frames = self.clip.frames
+        animation.clock.add(self, self.clip)
 
         # world spawn: near the end but visible on screen
         enemy_w = self.image.get_width()
-        bg_w = max(1, self.background.image.get_width())
+        bg_w = max(1, self.background.world_width)
         max_x = max(0, bg_w - enemy_w)
         # prefer near end but not off-screen: end_margin and visible clamp
         end_margin = 300
@@ -656,15 +630,8 @@ class Boss(pygame.sprite.Sprite):
         return p
 
     def update(self, dt=0):
-        # animation
-        self.frame_timer += dt
+        # animation frames are advanced by animation.clock
         self.hit_cooldown = max(0, self.hit_cooldown - dt)
-        if self.frame_timer >= self.frame_duration:
-            self.frame_timer = 0
-            self.frame_index = (self.frame_index + 1) % len(self.frames)
-            center = self.rect.center
-            self.image = pygame.transform.scale(self.frames[self.frame_index], self.size)
-            self.rect = self.image.get_rect(center=center)
 
         # firing logic: chooses random projectile type and fires toward player when cooldown elapses
         self.fire_timer += dt
@@ -679,6 +646,14 @@ class Boss(pygame.sprite.Sprite):
         self.rect.y = int(self.world_y + getattr(self.background.rect, 'y', 0))
 
 
+# animation frames shared by every boss projectile
+FIREBALL_FRAMES = [
+    "src/Images/weapon/fireball/firebal_0.gif",
+    "src/Images/weapon/fireball/firebal_1.gif",
+    "src/Images/weapon/fireball/firebal_2.gif",
+]
+
+
 class BigFireball(pygame.sprite.Sprite):
     """Slow, large red fireball."""
     def __init__(self, owner, speed=100):
@@ -686,18 +661,11 @@ class BigFireball(pygame.sprite.Sprite):
         self.owner = owner
         # Boss projectile damage
         self.damage = 75
-        self.frames = [
-            pygame.image.load("src/Images/weapon/fireball/firebal_0.gif"),
-            pygame.image.load("src/Images/weapon/fireball/firebal_1.gif"),
-            pygame.image.load("src/Images/weapon/fireball/firebal_2.gif"),
-        ]
         # Scale frames to large size (big fireball)
-        self.frames = [pygame.transform.scale(img, (80, 80)) for img in self.frames]
-        self.image = self.frames[0]
+        self.clip = animation.get_clip(FIREBALL_FRAMES, (80, 80), 100)
+        self.frames = self.clip.frames
+        animation.clock.add(self, self.clip)
         self.rect = self.image.get_rect()
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.frame_duration = 100
         # spawn just outside boss facing player (compute world coords)
         try:
             player_world_x = self.owner.player.rect.x - self.owner.background.rect.x
@@ -730,16 +698,8 @@ class BigFireball(pygame.sprite.Sprite):
         self.rect.x = int(self.world_x + self.owner.background.rect.x)
         self.rect.y = int(self.world_y + self.owner.background.rect.y)
         self.timer += dt
-        
-        # animate frames
-        self.frame_timer += dt
-        if self.frame_timer >= self.frame_duration:
-            self.frame_timer = 0
-            self.frame_index += 1
-            if self.frame_index >= len(self.frames):
-                self.frame_index = 0
-            self.image = self.frames[self.frame_index]
-        
+        # frames are advanced by animation.clock
+
         if self.timer >= self.count_time:
             self.kill()
 
@@ -752,12 +712,9 @@ class SmallFireball(pygame.sprite.Sprite):
         # Boss projectile damage
         self.damage = 75
         size = 20
-        self.frames = [
-            pygame.image.load("src/Images/weapon/fireball/firebal_0.gif"),
-            pygame.image.load("src/Images/weapon/fireball/firebal_1.gif"),
-            pygame.image.load("src/Images/weapon/fireball/firebal_2.gif"),
-        ]
-        self.image = self.frames[0]
+        self.clip = animation.get_clip(FIREBALL_FRAMES, frame_duration=100)
+        self.frames = self.clip.frames
+        animation.clock.add(self, self.clip)
         self.rect = self.image.get_rect()
         try:
             player_world_x = self.owner.player.rect.x - self.owner.background.rect.x
@@ -782,10 +739,6 @@ class SmallFireball(pygame.sprite.Sprite):
         self.count_time = 10000
         self.kind = 'small'
 
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.frame_duration = 100 
-
         self.timer = 0
         # Fireball lasts for 2 seconds
         self.count_time = 10000
@@ -795,16 +748,7 @@ class SmallFireball(pygame.sprite.Sprite):
         self.rect.x = int(self.world_x + self.owner.background.rect.x)
         self.rect.y = int(self.world_y + self.owner.background.rect.y)
         self.timer += dt
-
-        self.frame_timer += dt
-        if self.frame_timer >= self.frame_duration:
-            self.frame_timer = 0
-            self.frame_index += 1
-
-            if self.frame_index >= len(self.frames):
-                self.frame_index = 0
-
-            self.image = self.frames[self.frame_index]
+        # frames are advanced by animation.clock
         if self.timer >= self.count_time:
             self.kill()
 
@@ -814,18 +758,11 @@ class TracingFireball(pygame.sprite.Sprite):
     def __init__(self, owner, speed=150):
         super().__init__()
         self.owner = owner
-        self.frames = [
-            pygame.image.load("src/Images/weapon/fireball/firebal_0.gif"),
-            pygame.image.load("src/Images/weapon/fireball/firebal_1.gif"),
-            pygame.image.load("src/Images/weapon/fireball/firebal_2.gif"),
-        ]
         # Scale frames to medium size (tracing fireball)
-        self.frames = [pygame.transform.scale(img, (50, 50)) for img in self.frames]
-        self.image = self.frames[0]
+        self.clip = animation.get_clip(FIREBALL_FRAMES, (50, 50), 100)
+        self.frames = self.clip.frames
+        animation.clock.add(self, self.clip)
         self.rect = self.image.get_rect()
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.frame_duration = 100
         # spawn toward player's side (screen coords -> world coords)
         try:
             player_world_x = self.owner.player.rect.x - self.owner.background.rect.x
@@ -871,20 +808,52 @@ class TracingFireball(pygame.sprite.Sprite):
             self.world_x = float(self._pos.x)
             self.rect.x = int(self.world_x + self.owner.background.rect.x)
 
-        # animate frames
-        self.frame_timer += dt
-        if self.frame_timer >= self.frame_duration:
-            self.frame_timer = 0
-            self.frame_index += 1
-            if self.frame_index >= len(self.frames):
-                self.frame_index = 0
-            self.image = self.frames[self.frame_index]
-
+        # frames are advanced by animation.clock
         self.timer += dt
         if self.timer >= self.count_time:
             self.kill()
 
 
+# (frame paths, size before rotation, base rotation, facing that needs an extra 180 turn)
+WEAPON_SPECS = {
+    'basic': (["src/Images/weapon/sword/basic/Basic_sword.png"], (35, 100), -90, 'left'),
+    'flame': ([
+        "src/Images/weapon/sword/fire/frame_0_delay-0.17s.gif",
+        "src/Images/weapon/sword/fire/frame_1_delay-0.17s.gif",
+        "src/Images/weapon/sword/fire/frame_2_delay-0.17s.gif",
+    ], (40, 110), -90, 'left'),
+    'obsidian': ([r"src\Images\weapon\sword\obsidian\Obsidian_sword.png"], (35, 100), -90, 'left'),
+    'arrow': (["src/Images/weapon/arrow/TheArrow.png"], (60, 35), -180, 'right'),
+}
+
+# (weapon, facing) -> AnimationClip of ready-to-blit frames
+_weapon_variants = {}
+
+
+def build_weapon_variants():
+    """
+    Pre-compute the scaled and rotated frames for every (weapon, facing) pair so
+    spawning a blade or arrow is only a dictionary lookup. Safe to call more than once.
+    """
+    for weapon, (paths, size, angle, turned) in WEAPON_SPECS.items():
+        if (weapon, 'left') in _weapon_variants:
+            continue
+        frames = [pygame.transform.rotate(img, angle) for img in assets.load_frames(paths, size, convert="alpha")]
+        turned_frames = [pygame.transform.rotate(img, 180) for img in frames]
+        for facing in ('left', 'right'):
+            _weapon_variants[(weapon, facing)] = animation.AnimationClip(turned_frames if facing == turned else frames, 100)
+
+
+def weapon_clip(weapon, facing):
+    """Return the AnimationClip for `weapon` facing 'left' or 'right' (anything else counts as right)."""
+    key = (weapon, 'left' if facing == 'left' else 'right')
+    clip = _weapon_variants.get(key)
+    if clip is None:
+        build_weapon_variants()
+        clip = _weapon_variants[key]
+    return clip
+
+
 class OtherBlade(pygame.sprite.Sprite):
     def __init__(self, owner, time=300, offset=(0,0)):
         """Create a short-lived blade that appears outside the player and then disappears.
@@ -893,37 +862,16 @@ class OtherBlade(pygame.sprite.Sprite):
         super().__init__()
         self.owner = owner
         self.offset = offset
-        # thin rectangle to look like a blade
-        self.frames = [
-            pygame.image.load("src/Images/weapon/sword/fire/frame_0_delay-0.17s.gif").convert_alpha(),
-            pygame.image.load("src/Images/weapon/sword/fire/frame_1_delay-0.17s.gif").convert_alpha(),
-            pygame.image.load("src/Images/weapon/sword/fire/frame_2_delay-0.17s.gif").convert_alpha(),
-        ]
-        #transforming the images to correct size
-        self.frames = [
-            pygame.transform.scale(img, (40, 110)) for img in self.frames
-        ]
-        #transforming the images to correct rotation
-        self.frames = [
-            pygame.transform.rotate(img, -90) for img in self.frames
-            ]
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.frame_duration = 100 
-
-        # adjust frames for facing direction before picking initial image
+        # pre-rotated flame sword frames for the owner's facing, animated by animation.clock
         facing = getattr(self.owner, 'facing', 'right')
-        if facing == 'left':
-            # rotate by 180 to flip the -90 rotated frames to face left
-            self.frames = [pygame.transform.rotate(img, 180) for img in self.frames]
-
-        # pick current image after any rotation so sizes are correct
-        self.image = self.frames[self.frame_index]
+        self.clip = weapon_clip('flame', facing)
+        self.frames = self.clip.frames
+        animation.clock.add(self, self.clip)
 
-        if facing == 'right':
-            x = self.owner.rect.right + 5 + self.offset[0]
-        else:
+        if facing == 'left':
             x = self.owner.rect.left - self.image.get_width() - 5 + self.offset[0]
+        else:
+            x = self.owner.rect.right + 5 + self.offset[0]
 
         y = self.owner.rect.centery - (self.image.get_height() // 2) + self.offset[1]
         self.rect = self.image.get_rect(topleft=(x, y))
@@ -935,17 +883,7 @@ class OtherBlade(pygame.sprite.Sprite):
 
     def update(self, dt):
         """Advance lifetime; blade does not move after spawning."""
-        self.frame_timer += dt
-
-        if self.frame_timer >= self.frame_duration:
-            self.frame_timer = 0
-            self.frame_index += 1
-
-            if self.frame_index >= len(self.frames):
-                self.frame_index = 0
-
-            self.image = self.frames[self.frame_index]
-
+        # frames are advanced by animation.clock
         self.timer += dt
         if self.timer >= self.count_time:
             self.kill()
@@ -958,16 +896,13 @@ class Blade(pygame.sprite.Sprite):
         super().__init__()
         self.owner = owner
         self.offset = offset
-        # thin rectangle to look like a blade
-        self.image = pygame.image.load("src/Images/weapon/sword/basic/Basic_sword.png").convert_alpha()
-        self.image = pygame.transform.rotate(self.image, -90)
-        self.image = pygame.transform.scale(self.image, (100, 35))
+        # pre-rotated sword image for the owner's facing
         facing = getattr(self.owner, 'facing', 'right')
-        if facing == 'right':
-            x = self.owner.rect.right + 5 + self.offset[0]
-        elif facing == "left":
-            self.image = pygame.transform.rotate(self.image, 180)
+        self.image = weapon_clip('basic', facing).frames[0]
+        if facing == "left":
             x = self.owner.rect.left - self.image.get_width() - 5 + self.offset[0]
+        else:
+            x = self.owner.rect.right + 5 + self.offset[0]
         y = self.owner.rect.centery - (self.image.get_height() // 2) + self.offset[1]
         self.rect = self.image.get_rect(topleft=(x, y))
 
@@ -991,54 +926,17 @@ class Bullet(pygame.sprite.Sprite):
         super().__init__()
         self.offset = offset
         self.owner = owner
-        self.frames = [
-            pygame.image.load("src/Images/weapon/arrow/TheArrow.png").convert_alpha(),
-           
-        ]
-        # simple rectangle to represent bullet
-        self.image = pygame.Surface((10, 5))
-        self.image.fill((0, 0, 0))
+        # pre-rotated arrow frames for the owner's facing
+        facing = getattr(owner, 'facing', 'right')
+        self.frames = weapon_clip('arrow', facing).frames
+        self.image = self.frames[0]
 
-        #transforming the images to correct size
-        self.frames = [
-            pygame.transform.scale(img, (60, 35)) for img in self.frames
-        ]
-        #transforming the images to correct rotation
-        self.frames = [
-            pygame.transform.rotate(img, -180) for img in self.frames
-            ]
         # spawn just outside the player depending on facing
-
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.frame_duration = 100 
-
-        # adjust frames for facing direction before picking initial image
-        facing = getattr(self.owner, 'facing', 'right')
-        if facing == 'right':
-            # rotate by 180 to flip the -90 rotated frames to face left
-            self.frames = [pygame.transform.rotate(img, 180) for img in self.frames]
-
-        # pick current image after any rotation so sizes are correct
-        self.image = self.frames[self.frame_index]
-
-        if facing == 'left':
-            x = self.owner.rect.right + 5 + self.offset[0]
-        else:
-            x = self.owner.rect.left - self.image.get_width() - 5 + self.offset[0]
-
-        y = self.owner.rect.centery - (self.image.get_height() // 2) + self.offset[1]
-        self.rect = self.image.get_rect(topleft=(x, y))
-
-        self.timer = 0
-        self.count_time = 300
-
-        facing = getattr(owner, 'facing', 'right')
         if facing == 'right':
-            x = owner.rect.right + 5
+            x = owner.rect.right + 5 + self.offset[0]
         else:
-            x = owner.rect.left - self.image.get_width() - 5
-        y = owner.rect.centery - (self.image.get_height() // 2)
+            x = owner.rect.left - self.image.get_width() - 5 + self.offset[0]
+        y = owner.rect.centery - (self.image.get_height() // 2) + self.offset[1]
 
         self.rect = self.image.get_rect(topleft=(x, y))
 
@@ -1056,8 +954,6 @@ class Bullet(pygame.sprite.Sprite):
 
     def update(self, dt):
         """Move the bullet using dt (milliseconds) and expire after count_time."""
-        # advance animation timer
-        self.frame_timer += dt
         # move with subpixel precision
         self._pos_x += self.vx * dt
         self.rect.x = int(self._pos_x)
@@ -1073,18 +969,11 @@ class BossBullet(pygame.sprite.Sprite):
     def __init__(self, owner, speed=220):
         super().__init__()
         self.owner = owner
-        self.frames = [
-            pygame.image.load("src/Images/weapon/fireball/firebal_0.gif"),
-            pygame.image.load("src/Images/weapon/fireball/firebal_1.gif"),
-            pygame.image.load("src/Images/weapon/fireball/firebal_2.gif"),
-        ]
         # Scale frames to large size for boss bullet
-        self.frames = [pygame.transform.scale(img, (60, 60)) for img in self.frames]
-        self.image = self.frames[0]
+        self.clip = animation.get_clip(FIREBALL_FRAMES, (60, 60), 100)
+        self.frames = self.clip.frames
+        animation.clock.add(self, self.clip)
         self.rect = self.image.get_rect()
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.frame_duration = 100
         # spawn just outside the boss facing the player (compute world coords)
         try:
             player_world_x = self.owner.player.rect.x - self.owner.background.rect.x
@@ -1117,16 +1006,8 @@ class BossBullet(pygame.sprite.Sprite):
         self.rect.x = int(self.world_x + self.owner.background.rect.x)
         self.rect.y = int(self.world_y + self.owner.background.rect.y)
         self.timer += dt
-        
-        # animate frames
-        self.frame_timer += dt
-        if self.frame_timer >= self.frame_duration:
-            self.frame_timer = 0
-            self.frame_index += 1
-            if self.frame_index >= len(self.frames):
-                self.frame_index = 0
-            self.image = self.frames[self.frame_index]
-        
+        # frames are advanced by animation.clock
+
         if self.timer >= self.count_time:
             self.kill()
 
@@ -1155,8 +1036,7 @@ class Intro(pygame.sprite.Sprite):
         if self.index < len(self.sentences):
             self.surface.fill((0, 0, 0, 160))
             text = self.sentences[self.index]
-            text_surf = self.font.render(text, True, (255, 255, 255))
-            self.surface.blit(text_surf, (10, 10))
+            self.text.draw(self.surface, text, (10, 10))
 
     def start(self):
 
@@ -1164,7 +1044,9 @@ class Intro(pygame.sprite.Sprite):
         self.active = True
         self.index = 0
 
-        self.font = pygame.font.SysFont(None, 20)
+        self.font = fonts.get_font(None, 20)
+        # the tutorial lines are redrawn every frame, so they come from a glyph atlas
+        self.text = glyphs.get_atlas(self.font, (255, 255, 255))
 
 
         #text box
@@ -1176,10 +1058,14 @@ class Intro(pygame.sprite.Sprite):
         # Render the first line
         if self.sentences:
             text = self.sentences[0]
-            text_surf = self.font.render(text, True, (255, 255, 255))
-            self.surface.blit(text_surf, (10, 10))
+            self.text.draw(self.surface, text, (10, 10))
 
     def update(self, dt=0):
+        # the box is redrawn in place, so tell dirty-rect rendering when the line shown changes
+        shown = (self.active, getattr(self, 'index', 0))
+        if shown != getattr(self, 'shown', None):
+            self.shown = shown
+            self.dirty = 1
         
         # if the box is not actived, make the text box invisible
         if not self.active:
@@ -1192,8 +1078,7 @@ class Intro(pygame.sprite.Sprite):
         #only render if active and index is valid
         if self.active and self.index < len(self.sentences):
             text = self.sentences[self.index]
-            text_surf = self.font.render(text, True, (255, 255, 255))
-            self.surface.blit(text_surf, (10, 30))
+            self.text.draw(self.surface, text, (10, 30))
 
         elif not self.active or self.index >= len(self.sentences):
             # clear the text box
@@ -1206,14 +1091,13 @@ class Rock(pygame.sprite.Sprite):
         self.background = background
 
         # Load and prepare image
-        self.image = pygame.image.load("src/Images/map/obstacles/rock.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, size)
+        self.image = assets.load_image("src/Images/map/obstacles/rock.png", size, convert="alpha")
         self.width = self.image.get_width()
         self.height = self.image.get_height()
 
         # Choose a random position inside the background (world coordinates)
-        max_x = max(0, self.background.image.get_width() - self.width)
-        max_y = max(0, self.background.image.get_height() - self.height)
+        max_x = max(0, self.background.world_width - self.width)
+        max_y = max(0, self.background.world_height - self.height)
 
         # Spawn to the right of the player
         def _random_x_right_of_player():
@@ -1278,14 +1162,13 @@ class Spike(pygame.sprite.Sprite):
         self.background = background
 
         # Load and prepare image
-        self.image = pygame.image.load("src/Images/map/obstacles/spike.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, size)
+        self.image = assets.load_image("src/Images/map/obstacles/spike.png", size, convert="alpha")
         self.width = self.image.get_width()
         self.height = self.image.get_height()
 
         # Choose a random position inside the background (world coordinates)
-        max_x = max(0, self.background.image.get_width() - self.width)
-        max_y = max(0, self.background.image.get_height() - self.height)
+        max_x = max(0, self.background.world_width - self.width)
+        max_y = max(0, self.background.world_height - self.height)
 
         def _random_x_right_of_player():
             if player is None:
@@ -1344,7 +1227,15 @@ class Spike(pygame.sprite.Sprite):
 
 
 class Portal(pygame.sprite.Sprite):
-    
+    FRAMES = [
+        r"src\Images\portals\portal0.gif",
+        r"src\Images\portals\portal1.gif",
+        r"src\Images\portals\portal2.gif",
+        r"src\Images\portals\portal3.gif",
+        r"src\Images\portals\portal4.gif"
+    ]
+    SIZE = (80, 150)
+
     def __init__(self, player, background, screen_width=1920, all_sprites=None, required_hits=50):
         super().__init__()
         self.player = player
@@ -1354,29 +1245,21 @@ class Portal(pygame.sprite.Sprite):
 
         # load boss frames (safe loads; if missing, create placeholder)
         try:
-            self.frames = [
-                pygame.image.load(r"src\Images\portals\portal0.gif"),
-                pygame.image.load(r"src\Images\portals\portal1.gif"),
-                pygame.image.load(r"src\Images\portals\portal2.gif"),
-                pygame.image.load(r"src\Images\portals\portal3.gif"),
-                pygame.image.load(r"src\Images\portals\portal4.gif")
-            ]
+            self.clip = animation.get_clip(self.FRAMES, self.SIZE, 400)
         except Exception:
             # fallback: two colored surfaces
-            f1 = pygame.Surface((200, 600), pygame.SRCALPHA); f1.fill((150, 30, 30))
-            f2 = pygame.Surface((200, 600), pygame.SRCALPHA); f2.fill((180, 60, 60))
-            self.frames = [f1, f2]
+            f1 = pygame.Surface((80, 150), pygame.SRCALPHA); f1.fill((150, 30, 30))
+            f2 = pygame.Surface((80, 150), pygame.SRCALPHA); f2.fill((180, 60, 60))
+            self.clip = animation.AnimationClip([f1, f2], 400)
 
         #portal size
         self.size = (80, 150)
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.frame_duration = 400
-        self.image = pygame.transform.scale(self.frames[self.frame_index], self.size)
+        self.frames = self.clip.frames
+        animation.clock.add(self, self.clip)
 
         # world spawn: near the end but visible on screen
         enemy_w = self.image.get_width()
-        bg_w = max(1, self.background.image.get_width())
+        bg_w = max(1, self.background.world_width)
         max_x = max(0, bg_w - enemy_w)
         # prefer near end but not off-screen: end_margin and visible clamp
         end_margin = 300
@@ -1401,15 +1284,7 @@ class Portal(pygame.sprite.Sprite):
 
 
     def update(self, dt=0):
-        # animation
-        self.frame_timer += dt
-        if self.frame_timer >= self.frame_duration:
-            self.frame_timer = 0
-            self.frame_index = (self.frame_index + 1) % len(self.frames)
-            center = self.rect.center
-            self.image = pygame.transform.scale(self.frames[self.frame_index], self.size)
-            self.rect = self.image.get_rect(center=center)
-
+        # animation frames are advanced by animation.clock
         # ensure rect follows background offset
         self.rect.x = int(self.world_x + self.background.rect.x)
         self.rect.y = self.world_y
@@ -1421,17 +1296,14 @@ class Shield(pygame.sprite.Sprite):
         self.owner = owner
         # Prefer the effect shield image; fall back to other known locations
         try:
-            self.image = pygame.image.load(r"src\Images\effect\sheild_active.gif").convert_alpha()
-            self.image = pygame.transform.scale(self.image, (100, 100))
+            self.image = assets.load_image(r"src\Images\effect\sheild_active.gif", (100, 100), convert="alpha")
         except Exception:
             try:
                 # older path used previously
-                self.image = pygame.image.load(r"src\Images\shield_active.gif").convert_alpha()
-                self.image = pygame.transform.scale(self.image, (100, 100))
+                self.image = assets.load_image(r"src\Images\shield_active.gif", (100, 100), convert="alpha")
             except Exception:
                 # final fallback to obsidian sword image
-                self.image = pygame.image.load(r"src\Images\weapon\sword\obsidian\Obsidian_sword.png").convert_alpha()
-                self.image = pygame.transform.scale(self.image, (100, 100))
+                self.image = assets.load_image(r"src\Images\weapon\sword\obsidian\Obsidian_sword.png", (100, 100), convert="alpha")
         self.rect = self.image.get_rect(center=owner.rect.center)
         self.timer = 0
         self.duration = 1000  # 1 second (expire if it doesn't block)
@@ -1478,16 +1350,13 @@ class ObsidianBlade(pygame.sprite.Sprite):
         super().__init__()
         self.owner = owner
         self.offset = offset
-        # Load obsidian sword image
-        self.image = pygame.image.load(r"src\Images\weapon\sword\obsidian\Obsidian_sword.png").convert_alpha()
-        self.image = pygame.transform.rotate(self.image, -90)
-        self.image = pygame.transform.scale(self.image, (100, 35))
+        # pre-rotated obsidian sword image for the owner's facing
         facing = getattr(self.owner, 'facing', 'right')
-        if facing == 'right':
-            x = self.owner.rect.right + 5 + self.offset[0]
-        elif facing == "left":
-            self.image = pygame.transform.rotate(self.image, 180)
+        self.image = weapon_clip('obsidian', facing).frames[0]
+        if facing == "left":
             x = self.owner.rect.left - self.image.get_width() - 5 + self.offset[0]
+        else:
+            x = self.owner.rect.right + 5 + self.offset[0]
         y = self.owner.rect.centery - (self.image.get_height() // 2) + self.offset[1]
         self.rect = self.image.get_rect(topleft=(x, y))
 
@@ -1510,14 +1379,13 @@ class Bush(pygame.sprite.Sprite):
         self.background = background
 
         # Load and prepare image
-        self.image = pygame.image.load("src/Images/map/obstacles/bush.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, size)
+        self.image = assets.load_image("src/Images/map/obstacles/bush.png", size, convert="alpha")
         self.width = self.image.get_width()
         self.height = self.image.get_height()
 
         # Choose a random position inside the background (world coordinates)
-        max_x = max(0, self.background.image.get_width() - self.width)
-        max_y = max(0, self.background.image.get_height() - self.height)
+        max_x = max(0, self.background.world_width - self.width)
+        max_y = max(0, self.background.world_height - self.height)
 
         # Spawn to the right of the player
         def _random_x_right_of_player():
@@ -1578,14 +1446,13 @@ class Tree1(pygame.sprite.Sprite):
         self.background = background
 
         # Load and prepare image
-        self.image = pygame.image.load("src/Images/map/obstacles/tree1.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, size)
+        self.image = assets.load_image("src/Images/map/obstacles/tree1.png", size, convert="alpha")
         self.width = self.image.get_width()
         self.height = self.image.get_height()
 
         # Choose a random position inside the background (world coordinates)
-        max_x = max(0, self.background.image.get_width() - self.width)
-        max_y = max(0, self.background.image.get_height() - self.height)
+        max_x = max(0, self.background.world_width - self.width)
+        max_y = max(0, self.background.world_height - self.height)
 
         # Spawn to the right of the player
         def _random_x_right_of_player():
@@ -1646,14 +1513,13 @@ class Tree2(pygame.sprite.Sprite):
         self.background = background
 
         # Load and prepare image
-        self.image = pygame.image.load("src/Images/map/obstacles/tree2.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, size)
+        self.image = assets.load_image("src/Images/map/obstacles/tree2.png", size, convert="alpha")
         self.width = self.image.get_width()
         self.height = self.image.get_height()
 
         # Choose a random position inside the background (world coordinates)
-        max_x = max(0, self.background.image.get_width() - self.width)
-        max_y = max(0, self.background.image.get_height() - self.height)
+        max_x = max(0, self.background.world_width - self.width)
+        max_y = max(0, self.background.world_height - self.height)
 
         # Spawn to the right of the player
         def _random_x_right_of_player():
@@ -1705,3 +1571,36 @@ class Tree2(pygame.sprite.Sprite):
         # Keep onscreen rect in sync with background offset
         self.rect.x = int(self.world_x + self.background.rect.x)
         self.rect.y = int(self.world_y + self.background.rect.y)
+
+
+def warmup_tasks(render_scale=1):
+    """
+    Return (name, callable) pairs that load and pre-scale every image and sound used in
+    gameplay, so the first Main.entities call only hits warm caches.
+    Used by the warm-up queue while the logo and main menu are shown.
+    render_scale: the level background is pre-scaled at this share of its size (see world_scale.py)
+    """
+    enemy_clips = ((Enemy.FRAMES_ROOT, (60, 60)), (Enemy.FRAMES_BAT, (30, 30)), (Enemy.FRAMES_TREE, (80, 80)))
+    obstacles = (
+        ("src/Images/map/obstacles/rock.png", (60, 60)),
+        ("src/Images/map/obstacles/spike.png", (60, 60)),
+        ("src/Images/map/obstacles/bush.png", (80, 80)),
+        ("src/Images/map/obstacles/tree1.png", (100, 120)),
+        ("src/Images/map/obstacles/tree2.png", (110, 130)),
+    )
+    # one task per background tile, so a frame never waits for the whole level to be scaled
+    background = background_tiles.get_background("src/Images/map/Battleground1.png",
+                                                  (round(10000 * render_scale), round(600 * render_scale)))
+    tiles = [(f"level 1 background tile {index}", lambda index=index: background.build(index))
+             for index in range(background.count)]
+    return tiles + [
+        ("player", lambda: [assets.load_frames(files, Player.SIZE) for files in Player.FRAME_FILES.values()]),
+        ("enemies", lambda: [animation.get_clip(files, size, 500, convert="alpha") for files, size in enemy_clips]),
+        ("boss", lambda: animation.get_clip(Boss.FRAMES, Boss.SIZE, 400, convert="alpha")),
+        ("portal", lambda: animation.get_clip(Portal.FRAMES, Portal.SIZE, 400)),
+        ("fireballs", lambda: [animation.get_clip(FIREBALL_FRAMES, size, 100) for size in ((80, 80), None, (50, 50), (60, 60))]),
+        ("weapons", build_weapon_variants),
+        ("shield", lambda: assets.load_image(r"src\Images\effect\sheild_active.gif", (100, 100), convert="alpha")),
+        ("obstacles", lambda: [assets.load_image(path, size, convert="alpha") for path, size in obstacles]),
+        ("sounds", lambda: sound_bank.bank.load_effects()),
+    ]
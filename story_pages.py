@@ -0,0 +1,118 @@
+"""
+date : 2026 january 20
+description : Compiled visual-novel stories.
+A story entry's text only changes when the player presses SPACE, so each story is compiled
+once per (story, player name, fonts, viewport): USER_NAME is substituted, the line is
+word-wrapped and the name, the wrapped lines and the instruction are rendered into one
+transparent text box per page. Drawing a page is then one blit, however long the line is.
+"""
+from collections import OrderedDict
+import pygame
+import assets
+
+WHITE = (255, 255, 255)
+INSTRUCTION = "Press SPACE or ENTER to continue, ESC to menu"
+INSTRUCTION_COLOR = (200, 200, 200)
+# the text box covers the bottom BOX_HEIGHT pixels of the screen
+BOX_HEIGHT = 170
+LINE_SPACING = 4
+
+
+def wrap(text, font, width):
+    """Split `text` into lines no wider than `width` (a single word wider than that gets a line of its own)."""
+    lines = []
+    line = ''
+    for word in text.split(' '):
+        test_line = word if not line else f"{line} {word}"
+        if font.size(test_line)[0] <= width:
+            line = test_line
+        else:
+            if line:
+                lines.append(line)
+            line = word
+    if line:
+        lines.append(line)
+    return lines
+
+
+class StoryPage:
+    """
+    One compiled story entry.
+    name / lines: the substituted speaker name and wrapped text
+    surface: the text box, to be blitted at `pos`
+    """
+
+    def __init__(self, name, lines, surface, pos):
+        self.name = name
+        self.lines = lines
+        self.surface = surface
+        self.pos = pos
+
+    def draw(self, surface):
+        """Blit the text box on `surface`."""
+        assets.audit.check(self.surface, "StoryPage")
+        return surface.blit(self.surface, self.pos)
+
+
+def compile_page(entry, player_name, font, name_font, size):
+    """Substitute, wrap and render one story entry for a screen of `size`."""
+    width, height = size
+    top = height - BOX_HEIGHT
+    name = entry.get("name", "").replace("USER_NAME", player_name)
+    line = entry.get("line", "").replace("USER_NAME", player_name)
+    box = pygame.Surface((width, BOX_HEIGHT), pygame.SRCALPHA)
+    box.blit(name_font.render(name, True, WHITE), (50, 0))
+    # wrapped text goes in (50, height - 140, width - 100, 120); lines below it are cut
+    lines = wrap(line, font, width - 100)
+    y, bottom = 30, 150
+    shown = []
+    for text in lines:
+        if y > bottom:
+            break
+        rendered = font.render(text, True, WHITE)
+        box.blit(rendered, (50, y))
+        shown.append(text)
+        y += rendered.get_height() + LINE_SPACING
+    box.blit(font.render(INSTRUCTION, True, INSTRUCTION_COLOR), (50, BOX_HEIGHT - 30))
+    if pygame.display.get_surface():
+        box = box.convert_alpha()
+    return StoryPage(name, shown, box, (0, top))
+
+
+class StoryCompiler:
+    """
+    Keeps the compiled pages of the `capacity` most recently shown stories.
+    Fonts come from fonts.get_font, so the same Font object means the same font.
+    """
+
+    def __init__(self, capacity=4):
+        self.capacity = capacity
+        self._stories = OrderedDict()
+        self.compiled = 0
+
+    def get(self, story, story_data, player_name, font, name_font, size):
+        """Return the list of StoryPages of `story` (compiling it on first use)."""
+        key = (story, player_name, font, name_font, tuple(size))
+        pages = self._stories.get(key)
+        if pages is not None:
+            self._stories.move_to_end(key)
+            return pages
+        pages = [compile_page(entry, player_name, font, name_font, size) for entry in story_data]
+        self.compiled += 1
+        self._stories[key] = pages
+        if len(self._stories) > self.capacity:
+            self._stories.popitem(last=False)
+        return pages
+
+    def clear(self):
+        """Forget every compiled story (e.g. after editing a story file)."""
+        self._stories.clear()
+
+
+# shared compiler used by the visual novel screens
+compiler = StoryCompiler()
+
+
+def get_pages(story, story_data, player_name, font, name_font, size):
+    """Shortcut for compiler.get(), see StoryCompiler.get."""
+    return compiler.get(story, story_data, player_name, font, name_font, size)
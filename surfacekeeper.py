@@ -1,14 +1,32 @@
 import pygame
 import make_save
 import os
+import assets
+import bundles
+import dirty_render
+import fonts
+import glyphs
+import music
+import slide_cache
+import sound_bank
+import story_pages
 from json_loader import load_json
 import game_state
+import preload
 import random
+import sprite
+import warmup
+import world_scale
  
 class ScreenManager:
     """
     this class will define the base screen
     """
+    # a static screen only changes on input (see draw_dirty)
+    static = False
+    # set to True to have the next frame redrawn whole
+    redraw = True
+
     def __init__(self, app):
         """
         this method will initialize the screen
@@ -47,6 +65,33 @@ class ScreenManager:
         it take self and the surface as its parameter
         """
         pass
+    def changed_rects(self):
+        """
+        this method will return the rects of a static screen that changed since the last frame
+        """
+        return []
+
+    def draw_dirty(self, surface):
+        """
+        this method will draw the screen for dirty-rect rendering and return the rects drawn
+        (None when the whole screen was drawn, an empty list when nothing changed)
+        it take self and the surface as its parameter
+        """
+        if not self.static or self.redraw:
+            self.redraw = False
+            # the whole screen is drawn, so pending changes are covered
+            self.changed_rects()
+            surface.fill((0, 0, 0))
+            self.draw(surface)
+            return None
+        rects = dirty_render.merge(self.changed_rects())
+        for rect in rects:
+            surface.set_clip(rect)
+            surface.fill((0, 0, 0))
+            self.draw(surface)
+        surface.set_clip(None)
+        return rects
+
     def on_enter(self):
         """
         this method will be called when entering the screen
@@ -62,6 +107,8 @@ class ScreenManager:
 class Button:
     """
     This class defines a clickable button with hover effect.
+    The normal and hover looks are rendered once (and again only when the text changes),
+    and the hover state follows mouse-motion events, so drawing is a single blit.
     """
 
     def __init__(self, rect, text, onclick, font, bg=(80,80,80), hover_bg=(110,110,110), text_color=(255,255,255)):
@@ -77,13 +124,41 @@ class Button:
         self.bg = bg
         self.hover_bg = hover_bg
         self.text_color = text_color
+        # hover state starts from where the mouse is now, then follows MOUSEMOTION events
+        self.is_hover = self.rect.collidepoint(pygame.mouse.get_pos())
+        # True when the look changed since the last take_dirty()
+        self.dirty = False
+        self.render()
+
+    def render(self):
+        """
+        this method will pre-render the normal and hover looks of the button
+        """
+        label = glyphs.get_atlas(self.font, self.text_color).render(self.text)
+        self.images = {}
+        for hover, color in ((False, self.bg), (True, self.hover_bg)):
+            image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(image, color, image.get_rect(), border_radius=6)
+            #setting texts in the center of the button
+            image.blit(label, label.get_rect(center=image.get_rect().center))
+            self.images[hover] = image.convert_alpha() if pygame.display.get_surface() else image
+        self.dirty = True
+
+    def take_dirty(self):
+        """
+        this method will return whether the button must be redrawn, and clear that flag
+        """
+        dirty, self.dirty = self.dirty, False
+        return dirty
 
     def update_text(self, new_text):
         """
         this method will update the button text
         it take self and the new_text as its parameter
         """
-        self.text = new_text
+        if new_text != self.text:
+            self.text = new_text
+            self.render()
 
     def draw(self, surface):
         """
@@ -91,28 +166,20 @@ class Button:
         it take self and the surface as its parameter
         """
         #play hover efffect if mouse on button
-        mouse = pygame.mouse.get_pos()
-        is_hover = self.rect.collidepoint(mouse)
-        color = self.hover_bg 
-        if is_hover :
-            color = self.hover_bg
-        else:
-            color = self.bg
-        pygame.draw.rect(surface, color, self.rect, border_radius=6)
-
-        #setting texts and set text's collision box for clicking
-        txt = self.font.render(self.text, True, self.text_color)
-        txt_rect = txt.get_rect(center=self.rect.center)
-        surface.blit(txt, txt_rect)
+        surface.blit(self.images[self.is_hover], self.rect)
 
     def handle_event(self, event):
         """
         this method will handle the events during the button
         it take self and the event as its parameter
         """
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        if event.type == pygame.MOUSEMOTION:
+            hover = self.rect.collidepoint(event.pos)
+            if hover != self.is_hover:
+                self.is_hover = hover
+                self.dirty = True
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(event.pos):
-                self.onclick()
                 if callable(self.onclick):
                     self.onclick()
 
@@ -135,8 +202,11 @@ class LogoScreen(ScreenManager):
         self.display_duration = 3000  # 3 seconds
         self.fade_duration = 1000  # 1 second
         self.fading = False
+        # ms per frame spent warming up gameplay assets while the logo is static
+        self.warmup_budget = 25
 
     def update(self, dt):
+        self.app.warmup.step(self.warmup_budget)
         self.timer += dt
         if not self.fading and self.timer >= self.display_duration:
             self.fading = True
@@ -149,6 +219,8 @@ class LogoScreen(ScreenManager):
 
     def draw(self, surface):
         surface.blit(self.image, (0, 0))
+        w, h = self.app.size
+        self.app.warmup.draw_progress(surface, (w // 5, h - 30, w * 3 // 5, 6))
 
 
 class MainMenu(ScreenManager):
@@ -158,14 +230,14 @@ class MainMenu(ScreenManager):
         btn_w, btn_h = 200, 50
         cx = w // 2 - btn_w // 2
         top = h // 2 - 100
-        self.title_font = pygame.font.SysFont(None, 56)
-        self.font = pygame.font.SysFont(None, 28)
+        self.title_font = fonts.get_font(None, 56)
+        self.font = fonts.get_font(None, 28)
 
         # Try to load background image, use solid color if not available
+        # (held by the 'menu' bundle until the menu is left)
+        bundles.loader.acquire("menu")
         try:
-            self.image = pygame.image.load("src/Images/intro/menu.png")
-            self.image = pygame.transform.scale(self.image, (2000, 600))
-            self.image = self.image.convert()
+            self.image = assets.load_image("src/Images/intro/menu.png", (2000, 600), "convert")
         except:
             self.image = None
 
@@ -173,6 +245,10 @@ class MainMenu(ScreenManager):
         if self.image:
             self.scroll_offset = 0
             self.scroll_speed = 1
+        # keep warming up gameplay assets (smaller budget so scrolling stays smooth)
+        self.warmup_budget = 8
+        # have the first Introduction slide ready before it is opened
+        slide_cache.intro_slides.prefetch([p for p in ShowIntro.SLIDES[:1] if os.path.exists(p)])
         
         # 5 buttons: play, intro, load save, visual novel, quit
         self.buttons = [
@@ -181,9 +257,12 @@ class MainMenu(ScreenManager):
             Button((cx, top + 3*(btn_h+14), btn_w, btn_h), "Load Save", self.load_save, self.font),
             Button((cx, top + 5*(btn_h+14), btn_w, btn_h), "Quit", self.quit_game, self.font),
         ]
+        # static texts are rendered once
+        self.title = self.title_font.render("Monster Mash", True, (255, 220, 60))
 
     def update(self, dt):
         '''Called automatically during Refresh to update sprite's position.'''
+        self.app.warmup.step(self.warmup_budget)
         if self.image:
             # Move scroll offset
             self.scroll_offset -= self.scroll_speed
@@ -210,6 +289,7 @@ class MainMenu(ScreenManager):
         
         # draw scrolling background image if available
         if self.image:
+            assets.audit.check(self.image, "MainMenu")
             img_width = self.image.get_width()
             screen_width = self.app.size[0]
             # Calculate starting x position
@@ -221,12 +301,17 @@ class MainMenu(ScreenManager):
                 surface.blit(self.image, (x, 0))
                 x += img_width
         
-        title = self.title_font.render("Monster Mash", True, (255, 220, 60))
-        surface.blit(title, title.get_rect(center=(self.app.size[0]//2, 50)))
+        surface.blit(self.title, self.title.get_rect(center=(self.app.size[0]//2, 50)))
 
         for b in self.buttons:
             b.draw(surface)
 
+        w, h = self.app.size
+        self.app.warmup.draw_progress(surface, (w // 5, h - 12, w * 3 // 5, 4))
+
+    def on_exit(self):
+        bundles.loader.release("menu")
+
     def play_game(self):
         # Start name input
         self.app.change_screen(NameInput(self.app))
@@ -242,40 +327,44 @@ class MainMenu(ScreenManager):
         self.app.quit()
 
 class ShowIntro(ScreenManager):
+    static = True
+    SLIDES = [
+        "src/Images/intro/intro-1.png",
+        "src/Images/intro/intro-2.png",
+        "src/Images/intro/intro-3.png",
+        "src/Images/intro/intro-4.png",
+        "src/Images/intro/intro-5.png",
+        "src/Images/intro/intro-6.png",
+        "src/Images/intro/intro-7.png",
+    ]
+
     def __init__(self, app):
         super().__init__(app)
 
-        self.font = pygame.font.SysFont(None, 24)
+        self.font = fonts.get_font(None, 24)
         self.intro_index = 0
 
-        paths = [
-            "src/Images/intro/intro-1.png",
-            "src/Images/intro/intro-2.png",
-            "src/Images/intro/intro-3.png",
-            "src/Images/intro/intro-4.png",
-            "src/Images/intro/intro-5.png",
-            "src/Images/intro/intro-6.png",
-            "src/Images/intro/intro-7.png",
-        ]
-
-        self.intro_images = []
-        for p in paths:
-            try:
-                img = pygame.image.load(p)
-                img = pygame.transform.scale(img, (800, 450))
-                img = img.convert()
-                self.intro_images.append(img)
-            except:
-                # Skip images that don't exist
-                pass
-
-        self.total = len(self.intro_images)
-        if self.total == 0:
-            # Create a placeholder surface if no images loaded
-            placeholder = pygame.Surface((800, 450))
-            placeholder.fill((50, 50, 50))
-            self.intro_images.append(placeholder)
-            self.total = 1
+        # Skip images that don't exist; slides are decoded only when shown
+        # (see slide_cache.py), the neighbours of the current one in the background
+        self.paths = [p for p in self.SLIDES if os.path.exists(p)]
+        self.total = max(1, len(self.paths))
+        # Placeholder surface for a missing or broken slide
+        self.placeholder = pygame.Surface((800, 450))
+        self.placeholder.fill((50, 50, 50))
+        self.show_slide(0)
+
+    def show_slide(self, index):
+        """Make slide `index` current and prefetch the slides next to it."""
+        self.intro_index = index
+        self.redraw = True
+        if not self.paths:
+            self.image = self.placeholder
+            return
+        try:
+            self.image = slide_cache.intro_slides.get(self.paths[index])
+        except (pygame.error, OSError):
+            self.image = self.placeholder
+        slide_cache.intro_slides.prefetch(self.paths[max(0, index - 1):index + 2])
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -284,44 +373,91 @@ class ShowIntro(ScreenManager):
                 self.app.change_screen(MainMenu(self.app))
 
             elif event.key in (pygame.K_LEFT, pygame.K_a):
-                self.intro_index -= 1
+                self.show_slide(max(0, self.intro_index - 1))
 
             elif event.key in (pygame.K_RIGHT, pygame.K_d):
-                self.intro_index += 1
-
-            self.intro_index = max(0, min(self.intro_index, self.total - 1))
+                self.show_slide(min(self.intro_index + 1, self.total - 1))
 
     def draw(self, surface):
         surface.fill((12, 12, 40))
 
         # draw the image in center
-        img = self.intro_images[self.intro_index]
+        img = self.image
+        assets.audit.check(img, "ShowIntro")
         rect = img.get_rect(center=surface.get_rect().center)
         surface.blit(img, rect)
 
 
 class VisualNovel(ScreenManager):
+    static = True
+    # number of upcoming lines whose background and voice clip are decoded in the background
+    PREFETCH_AHEAD = 3
+    # level each story leads into; its bundle is preloaded while the story is read
+    NEXT_LEVEL = {"intro": 1, "boss_defeat": 1, "level1_end": 1}
+
     def __init__(self, app, story_part="intro", previous_screen=None, story_index=0):
         super().__init__(app)
-        self.font = pygame.font.SysFont(None, 24)
-        self.name_font = pygame.font.SysFont(None, 28)
+        self.font = fonts.get_font(None, 24)
+        self.name_font = fonts.get_font(None, 28)
         self.story_part = story_part
         self.previous_screen = previous_screen
         self.story_file = f"stories/{story_part}.json"
         self.story_data = load_json(self.story_file) or []
         self.current_index = story_index
         self.background = None
-        self.load_current_background()
         pygame.mixer.init()  # Ensure mixer is initialized
+        # substitution, wrapping and text rendering are done once per story
+        self.pages = story_pages.get_pages(self.story_file, self.story_data, self.app.game_state.player_name,
+                                           self.font, self.name_font, self.app.size)
+        # the current page over its background, recomposed only when the line changes
+        self.frame = pygame.Surface(self.app.size).convert()
+        self.prefetch_story(self.app, self.story_data, self.current_index)
+        self.load_current_background()
+        level = self.next_level()
+        if level:
+            bundles.loader.preload(f"level{level}", self.app.warmup)
+
+    def next_level(self):
+        """Return the level this story leads into, None when it leads back to a menu."""
+        return self.NEXT_LEVEL.get(self.story_part)
+
+    @staticmethod
+    def entry_paths(entry):
+        """Return the (background image, voice clip) paths of a story entry, None when it has none."""
+        background = entry.get("background")
+        sound = entry.get("sound")
+        return (os.path.join("src", "Images", background) if background else None,
+                os.path.join("src", "Sounds", sound) if sound else None)
+
+    @classmethod
+    def prefetch_story(cls, app, story_data, start=0):
+        """Queue the backgrounds and voice clips of the entries from `start` to PREFETCH_AHEAD lines after it."""
+        entries = [cls.entry_paths(entry) for entry in story_data[start:start + cls.PREFETCH_AHEAD + 1]]
+        app.story_backgrounds.prefetch([bg for bg, _ in entries if bg])
+        app.story_clips.prefetch([sound for _, sound in entries if sound])
 
     def load_current_background(self):
         if self.story_data and self.current_index < len(self.story_data):
-            bg_path = os.path.join("src", "Images", self.story_data[self.current_index].get("background", ""))
+            bg_path, _ = self.entry_paths(self.story_data[self.current_index])
             try:
-                self.background = pygame.image.load(bg_path)
-                self.background = pygame.transform.scale(self.background, self.app.size)
+                # decoded ahead of time by the prefetch thread, so this only swaps the image
+                self.background = self.app.story_backgrounds.get(bg_path) if bg_path else None
             except:
                 self.background = None
+            self.compose()
+
+    def compose(self):
+        """Draw the background and the compiled text box of the current line into `frame`."""
+        self.frame.fill((0, 0, 0))  # Black background if no image
+        if self.background:
+            assets.audit.check(self.background, "VisualNovel")
+            self.frame.blit(self.background, (0, 0))
+        self.pages[self.current_index].draw(self.frame)
+        self.redraw = True
+
+    def update(self, dt):
+        # use the reading time to finish any queued preloads
+        self.app.warmup.step(4)
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -333,13 +469,16 @@ class VisualNovel(ScreenManager):
     def advance_story(self):
         if self.current_index < len(self.story_data) - 1:
             # Play sound effect
-            sound_path = os.path.join("src", "Sounds", self.story_data[self.current_index].get("sound", ""))
-            try:
-                sound = pygame.mixer.Sound(sound_path)
-                sound.play()
-            except:
-                pass  # No sound or error
+            _, sound_path = self.entry_paths(self.story_data[self.current_index])
+            if sound_path:
+                try:
+                    clip = self.app.story_clips.get(sound_path)
+                except (pygame.error, OSError):
+                    clip = None  # missing or broken clip: the story goes on silently
+                if clip is not None:
+                    sound_bank.bank.play_sound(clip, sound_bank.VOICE)
             self.current_index += 1
+            self.prefetch_story(self.app, self.story_data, self.current_index)
             # Update story index in game state
             if self.app.game_state:
                 self.app.game_state.story_index = self.current_index
@@ -383,64 +522,20 @@ class VisualNovel(ScreenManager):
             self.app.change_screen(MainMenu(self.app))
 
     def draw(self, surface):
-        surface.fill((0, 0, 0))  # Black background if no image
-        if self.background:
-            surface.blit(self.background, (0, 0))
-
         if self.story_data and self.current_index < len(self.story_data):
-            data = self.story_data[self.current_index]
-            name = data.get("name", "").replace("USER_NAME", self.app.game_state.player_name)
-            line = data.get("line", "").replace("USER_NAME", self.app.game_state.player_name)
-
-            # Draw name
-            name_text = self.name_font.render(name, True, (255, 255, 255))
-            surface.blit(name_text, (50, self.app.size[1] - 170))
-
-            # Draw line with wrapping to avoid overflow
-            wrap_rect = pygame.Rect(50, self.app.size[1] - 140, self.app.size[0] - 100, 120)
-            self._render_text_block(surface, line, self.font, (255, 255, 255), wrap_rect)
-
-            # Instruction
-            instr = self.font.render("Press SPACE or ENTER to continue, ESC to menu", True, (200, 200, 200))
-            surface.blit(instr, (50, self.app.size[1] - 30))
-
-    def _render_text_block(self, surface, text, font, color, rect, line_spacing=4):
-        """Render `text` inside `rect` with word-wrapping using `font`.
-
-        - `rect` is a pygame.Rect defining position and max width/height.
-        - Lines that don't fit vertically will be truncated.
-        """
-        words = text.split(' ')
-        space_width, space_height = font.size(' ')
-        x, y = rect.topleft
-        max_x = rect.right
-        line = ''
-        for word in words:
-            test_line = word if not line else f"{line} {word}"
-            test_width, _ = font.size(test_line)
-            if x + test_width <= max_x:
-                line = test_line
-            else:
-                # draw current line
-                if line:
-                    rendered = font.render(line, True, color)
-                    surface.blit(rendered, (x, y))
-                    y += rendered.get_height() + line_spacing
-                    if y > rect.bottom:
-                        return
-                line = word
-
-        # draw last line
-        if line and y <= rect.bottom:
-            rendered = font.render(line, True, color)
-            surface.blit(rendered, (x, y))
+            surface.blit(self.frame, (0, 0))
+        else:
+            surface.fill((0, 0, 0))
 
 
 class IntroScreen(VisualNovel):
     def __init__(self, app, level, game_state):
-        super().__init__(app, "intro", previous_screen=None)
         self.level = level
+        super().__init__(app, "intro", previous_screen=None)
         self.timer = 0  # Auto-advance timer
+
+    def next_level(self):
+        return self.level
     
     def update(self, dt):
         super().update(dt)
@@ -453,10 +548,12 @@ class IntroScreen(VisualNovel):
 
 
 class MakeSave(ScreenManager, make_save.SaveSystem):
+    static = True
+
     def __init__(self, app):
         ScreenManager.__init__(self, app)
         make_save.SaveSystem.__init__(self)
-        self.font = pygame.font.SysFont(None, 24)
+        self.font = fonts.get_font(None, 24)
         self.save_list = []
         self.selected_index = 0
         self.load_save_files()
@@ -472,6 +569,7 @@ class MakeSave(ScreenManager, make_save.SaveSystem):
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
+            self.redraw = True
             if event.key == pygame.K_ESCAPE:
                 self.app.change_screen(MainMenu(self.app))
             elif event.key == pygame.K_UP and len(self.save_list) > 1:
@@ -509,10 +607,12 @@ class MakeSave(ScreenManager, make_save.SaveSystem):
 
 
 class NameInput(ScreenManager):
+    static = True
+
     def __init__(self, app):
         super().__init__(app)
-        self.font = pygame.font.SysFont(None, 36)
-        self.input_font = pygame.font.SysFont(None, 48)
+        self.font = fonts.get_font(None, 36)
+        self.input_font = fonts.get_font(None, 48)
         self.prompt = "Enter your name:"
         self.name = ""
         self.cursor_visible = True
@@ -520,6 +620,7 @@ class NameInput(ScreenManager):
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
+            self.redraw = True
             if event.key == pygame.K_RETURN and self.name.strip():
                 self.app.game_state.new_game(self.name.strip())
                 self.app.change_screen(VisualNovel(self.app, "intro"))
@@ -536,6 +637,7 @@ class NameInput(ScreenManager):
         if self.cursor_timer >= 500:
             self.cursor_visible = not self.cursor_visible
             self.cursor_timer = 0
+            self.redraw = True
 
     def draw(self, surface):
         surface.fill((18, 20, 28))
@@ -550,9 +652,11 @@ class NameInput(ScreenManager):
 
 
 class MakeWhiteScreem(ScreenManager):
+    static = True
+
     def __init__(self, app):
         super().__init__(app)
-        self.font = pygame.font.SysFont(None, 24)
+        self.font = fonts.get_font(None, 24)
 
     def draw(self, surface):
         surface.fill((255, 255, 255))
@@ -560,15 +664,18 @@ class MakeWhiteScreem(ScreenManager):
 
 class UnderDevelopmentScreen(ScreenManager):
     """Simple screen that shows an 'under development' message and a button back to main menu."""
+    static = True
+
     def __init__(self, app):
         super().__init__(app)
-        self.font = pygame.font.SysFont(None, 36)
-        self.small = pygame.font.SysFont(None, 24)
+        self.font = fonts.get_font(None, 36)
+        self.small = fonts.get_font(None, 24)
         w, h = app.size
         btn_w, btn_h = 240, 48
         cx = w // 2 - btn_w // 2
         cy = h // 2 + 40
         self.back_button = Button((cx, cy, btn_w, btn_h), "Back to Main Menu", self.back_to_menu, self.small)
+        self.title = self.font.render("Under development, please wait", True, (255, 220, 60))
 
     def back_to_menu(self):
         self.app.change_screen(MainMenu(self.app))
@@ -576,15 +683,19 @@ class UnderDevelopmentScreen(ScreenManager):
     def handle_event(self, event):
         self.back_button.handle_event(event)
 
+    def changed_rects(self):
+        return [self.back_button.rect] if self.back_button.take_dirty() else []
+
     def draw(self, surface):
         surface.fill((18, 20, 28))
-        title = self.font.render("Under development, please wait", True, (255, 220, 60))
-        surface.blit(title, title.get_rect(center=(self.app.size[0]//2, self.app.size[1]//2 - 20)))
+        surface.blit(self.title, self.title.get_rect(center=(self.app.size[0]//2, self.app.size[1]//2 - 20)))
         self.back_button.draw(surface)
 
 
 class TheEndScreen(ScreenManager):
     """Screen that shows the 'the_end' image and waits for key press to go to main menu."""
+    static = True
+
     def __init__(self, app):
         super().__init__(app)
         self.image_path = r"src\Images\story\the_end.gif"
@@ -593,7 +704,7 @@ class TheEndScreen(ScreenManager):
             self.image = pygame.transform.scale(self.image, self.app.size)
         except:
             self.image = None
-        self.font = pygame.font.SysFont(None, 24)
+        self.font = fonts.get_font(None, 24)
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -616,16 +727,20 @@ class TheEndScreen(ScreenManager):
 
 class HardModeChoiceScreen(ScreenManager):
     """Screen that asks the player if they want to enable hard mode."""
+    static = True
+
     def __init__(self, app):
         super().__init__(app)
-        self.font = pygame.font.SysFont(None, 36)
-        self.small = pygame.font.SysFont(None, 24)
+        self.font = fonts.get_font(None, 36)
+        self.small = fonts.get_font(None, 24)
         w, h = app.size
         btn_w, btn_h = 200, 48
         cx = w // 2 - btn_w // 2
         cy = h // 2 + 40
         self.yes_button = Button((cx - 120, cy, btn_w, btn_h), "Yes, Hard Mode", self.enable_hard_mode, self.small)
         self.no_button = Button((cx + 120, cy, btn_w, btn_h), "No, Normal", self.disable_hard_mode, self.small)
+        self.title = self.font.render("Congratulations on completing the game!", True, (255, 220, 60))
+        self.subtitle = self.font.render("Enable Hard Mode? (Enemies take 2x hits)", True, (255, 220, 60))
 
     def enable_hard_mode(self):
         if self.app.game_state:
@@ -643,12 +758,13 @@ class HardModeChoiceScreen(ScreenManager):
         self.yes_button.handle_event(event)
         self.no_button.handle_event(event)
 
+    def changed_rects(self):
+        return [b.rect for b in (self.yes_button, self.no_button) if b.take_dirty()]
+
     def draw(self, surface):
         surface.fill((18, 20, 28))
-        title = self.font.render("Congratulations on completing the game!", True, (255, 220, 60))
-        surface.blit(title, title.get_rect(center=(self.app.size[0]//2, self.app.size[1]//2 - 60)))
-        subtitle = self.font.render("Enable Hard Mode? (Enemies take 2x hits)", True, (255, 220, 60))
-        surface.blit(subtitle, subtitle.get_rect(center=(self.app.size[0]//2, self.app.size[1]//2 - 20)))
+        surface.blit(self.title, self.title.get_rect(center=(self.app.size[0]//2, self.app.size[1]//2 - 60)))
+        surface.blit(self.subtitle, self.subtitle.get_rect(center=(self.app.size[0]//2, self.app.size[1]//2 - 20)))
         self.yes_button.draw(surface)
         self.no_button.draw(surface)
 
@@ -668,16 +784,49 @@ class DeathCount(ScreenManager):
 
 class App:
     """Main application class that manages screen transitions and the game loop"""
-    def __init__(self, size=(1000, 600)):
+    def __init__(self, size=(1000, 600), preload_images=False, debug_formats=False, dirty_rects=False,
+                 render_scale=1.0, smooth_upscale=False):
+        """
+        size: window size
+        preload_images: decode the sprite images on all cores before the first screen, when
+            there are enough of them to pay for the process pool (see preload.py)
+        debug_formats: report sprites drawn with a Surface not in the display format
+        dirty_rects: redraw and present only the regions that changed (see dirty_render.py)
+        render_scale: share of the window resolution the level world is drawn at, then upscaled
+            to the window once per frame (0.5 = a quarter of the pixels, see world_scale.py)
+        smooth_upscale: upscale with smoothscale instead of the sharper, cheaper scale
+        """
         pygame.init()
         self.size = size
         self.screen = pygame.display.set_mode(size)
+        self.renderer = dirty_render.renderer
+        self.renderer.enabled = dirty_rects
+        # the gameplay screen draws the level through it when render_scale is below 1
+        self.world = world_scale.ScaledWorld(size, render_scale, smooth_upscale) if render_scale < 1 else None
+        if self.world:
+            # level backgrounds are only ever built at the internal resolution
+            bundles.loader.render_scale = render_scale
         pygame.display.set_caption("Monster Mash")
+        if debug_formats:
+            assets.audit.enabled = True
+        if preload_images:
+            paths = preload.startup_paths()
+            if preload.worth_preloading(paths):
+                print(preload.format_report(preload.preload_images(paths)))
         self.clock = pygame.time.Clock()
         self.running = True
         self.current_screen = None
         self.game_instance = None
         self.game_state = game_state.GameState()
+        # gameplay assets are loaded a little at a time by the logo and menu screens,
+        # and the shared gameplay bundle is kept for the whole session
+        self.warmup = warmup.WarmupQueue(sprite.warmup_tasks(render_scale if self.world else 1))
+        bundles.loader.acquire("gameplay", load=False)
+        # background music lives for the whole session (see music.py)
+        self.music = music.MusicManager()
+        # VisualNovel backgrounds and voice clips, decoded a few lines ahead
+        self.story_backgrounds = slide_cache.SlideCache(size, capacity=VisualNovel.PREFETCH_AHEAD + 2)
+        self.story_clips = slide_cache.ClipCache(capacity=2 * (VisualNovel.PREFETCH_AHEAD + 1))
         
         # Start with logo screen
         self.change_screen(LogoScreen(self))
@@ -688,6 +837,8 @@ class App:
             self.current_screen.on_exit()
         
         self.current_screen = new_screen
+        # a screen entered again (e.g. after a story) is drawn whole first
+        self.current_screen.redraw = True
         if hasattr(self.current_screen, "on_enter"):
             self.current_screen.on_enter()
     
@@ -727,6 +878,7 @@ class App:
         """Main application loop"""
         while self.running:
             dt = self.clock.tick(30)
+            self.music.update(dt)
             
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -734,11 +886,15 @@ class App:
                 if self.current_screen:
                     self.current_screen.handle_event(event)
             
+            rects = None
             if self.current_screen:
                 self.current_screen.update(dt)
-                self.screen.fill((0, 0, 0))
-                self.current_screen.draw(self.screen)
+                if self.renderer.enabled:
+                    rects = self.current_screen.draw_dirty(self.screen)
+                else:
+                    self.screen.fill((0, 0, 0))
+                    self.current_screen.draw(self.screen)
             
-            pygame.display.flip()
+            self.renderer.present(rects)
         
         pygame.quit()
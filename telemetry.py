@@ -0,0 +1,199 @@
+"""
+date : 2026 january 20
+description : Surface memory and asset load telemetry.
+The asset cache, the tiled background and the sound loader report every load here: how
+long the file took to decode (or map from disk), how long scaling/conversion took, how
+many bytes the Surface holds and how many of those Surfaces are still alive. Loads are
+attributed to the asset path and to the sprite class that asked for them.
+Press F9 in game to print the report, or run `python telemetry.py` to load every game
+asset headless and print where the startup time and memory go.
+"""
+import os
+import sys
+import weakref
+import pygame
+
+# modules that load on behalf of someone else; the owner is looked up past them
+_LOADER_MODULES = ("assets", "animation", "background_tiles", "bundles", "slide_cache", "warmup",
+                   "telemetry", "weakref")
+
+
+def surface_bytes(surface):
+    """Return the pixel memory owned by `surface` (subsurfaces share their parent's pixels)."""
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_pitch() * surface.get_height()
+
+
+def sound_bytes(sound):
+    """Return the decoded size of a mixer Sound."""
+    init = pygame.mixer.get_init()
+    if not init:
+        return 0
+    frequency, size, channels = init
+    return int(sound.get_length() * frequency * channels * abs(size) // 8)
+
+
+def caller_owner(depth=2):
+    """
+    Return the name of the sprite class (or module.function) that triggered the current load,
+    skipping the asset loading modules.
+    """
+    frame = sys._getframe(depth)
+    fallback = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module not in _LOADER_MODULES:
+            owner = frame.f_locals.get("self")
+            if isinstance(owner, pygame.sprite.Sprite) or hasattr(owner, "app"):
+                return type(owner).__name__
+            if fallback is None:
+                fallback = f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return fallback or "unknown"
+
+
+class _Stats:
+    """Counters of one asset path or one owner."""
+
+    __slots__ = ("loads", "decode", "scale", "live", "live_bytes", "total_bytes")
+
+    def __init__(self):
+        self.loads = 0
+        self.decode = 0.0
+        self.scale = 0.0
+        self.live = 0
+        self.live_bytes = 0
+        self.total_bytes = 0
+
+    def add(self, decode, scale, nbytes, tracked):
+        self.loads += 1
+        self.decode += decode
+        self.scale += scale
+        self.total_bytes += nbytes
+        if tracked:
+            self.live += 1
+            self.live_bytes += nbytes
+
+    def release(self, nbytes):
+        self.live -= 1
+        self.live_bytes -= nbytes
+
+
+class AssetTelemetry:
+    """
+    Records load timings and Surface memory per asset path and per owner.
+    Surfaces are followed with weak references, so the live counts drop when a Surface is
+    evicted from every cache and garbage collected.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.paths = {}
+        self.owners = {}
+
+    def _entries(self, path, owner):
+        return (self.paths.setdefault(path, _Stats()), self.owners.setdefault(owner, _Stats()))
+
+    def record(self, path, surface, decode=0.0, scale=0.0, owner=None):
+        """Record that `surface` was produced for `path`, spending `decode` and `scale` seconds."""
+        if not self.enabled:
+            return
+        owner = owner or caller_owner()
+        nbytes = surface_bytes(surface)
+        entries = self._entries(path, owner)
+        for stats in entries:
+            stats.add(decode, scale, nbytes, True)
+        weakref.finalize(surface, self._released, entries, nbytes)
+
+    def record_sound(self, path, sound, decode=0.0, owner=None):
+        """Record a decoded Sound (sounds are cached for the whole session, so they are not followed)."""
+        if not self.enabled:
+            return
+        nbytes = sound_bytes(sound)
+        for stats in self._entries(path, owner or caller_owner()):
+            stats.add(decode, 0.0, nbytes, False)
+            stats.live_bytes += nbytes
+
+    @staticmethod
+    def _released(entries, nbytes):
+        for stats in entries:
+            stats.release(nbytes)
+
+    def totals(self):
+        """Return (load seconds, live bytes, live surfaces) over every path."""
+        stats = self.paths.values()
+        return (sum(s.decode + s.scale for s in stats), sum(s.live_bytes for s in stats), sum(s.live for s in stats))
+
+    def clear(self):
+        """Forget every counter (Surfaces already followed keep updating the old entries)."""
+        self.paths = {}
+        self.owners = {}
+
+    def report(self, sort="bytes", limit=15, sprites=None):
+        """
+        Return the telemetry report as text.
+        sort: 'bytes' (live memory) or 'time' (decode + scale)
+        limit: number of asset paths listed
+        sprites: optional sprite group; adds the Surfaces currently drawn, per sprite class
+        """
+        key = (lambda s: s.live_bytes) if sort == "bytes" else (lambda s: s.decode + s.scale)
+        seconds, live_bytes, live = self.totals()
+        lines = [f"Assets: {len(self.paths)} paths, {live} live surfaces, {_mb(live_bytes)} live, "
+                 f"{seconds * 1000:.0f} ms spent loading"]
+        lines.append(_header("path"))
+        for path, stats in sorted(self.paths.items(), key=lambda item: key(item[1]), reverse=True)[:limit]:
+            lines.append(_row(path, stats))
+        lines.append(_header("owner"))
+        for owner, stats in sorted(self.owners.items(), key=lambda item: key(item[1]), reverse=True):
+            lines.append(_row(owner, stats))
+        if sprites is not None:
+            lines.append(sprite_report(sprites))
+        return "\n".join(lines)
+
+
+def sprite_report(group):
+    """Return, per sprite class in `group`, the number of sprites and of distinct images they draw."""
+    classes = {}
+    for spr in group:
+        images = classes.setdefault(type(spr).__name__, [0, {}])
+        images[0] += 1
+        image = getattr(spr, "image", None)
+        if image is not None:
+            images[1][id(image)] = surface_bytes(image)
+    lines = [f"{'sprite class':<40}{'sprites':>8}{'images':>8}{'memory':>10}"]
+    for name, (count, images) in sorted(classes.items(), key=lambda item: -sum(item[1][1].values())):
+        lines.append(f"{name:<40}{count:>8}{len(images):>8}{_mb(sum(images.values())):>10}")
+    return "\n".join(lines)
+
+
+def _mb(nbytes):
+    return f"{nbytes / (1024 * 1024):.1f} MB"
+
+
+def _header(title):
+    return f"{title:<40}{'loads':>6}{'decode':>9}{'scale':>9}{'live':>6}{'memory':>10}"
+
+
+def _row(name, stats):
+    if len(name) > 39:
+        name = "..." + name[-36:]
+    return (f"{name:<40}{stats.loads:>6}{stats.decode * 1000:>7.1f}ms{stats.scale * 1000:>7.1f}ms"
+            f"{stats.live:>6}{_mb(stats.live_bytes):>10}")
+
+
+# shared instance fed by the asset loaders
+tracker = AssetTelemetry()
+
+
+if __name__ == "__main__":
+    # load every bundle of the game headless and print where the time and memory go
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1000, 600))
+    import bundles
+    # the loaders report to the imported module's tracker, not to this script's copy
+    import telemetry
+    for name in ("gameplay", "level1", "level2", "menu"):
+        bundles.loader.acquire(name)
+    print(telemetry.tracker.report(sort=sys.argv[1] if len(sys.argv) > 1 else "bytes", limit=30))
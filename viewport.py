@@ -0,0 +1,68 @@
+"""
+date : 2026 january 20
+description : Viewport culling for the sprites of a level.
+Obstacles, enemies and projectiles are spread over the whole level, while only a screen's
+worth of it is visible. The gameplay screen draws through a Viewport, which skips every
+sprite whose rect does not meet the screen (grown by a margin) and counts how many were
+culled, so the draw cost follows what is on screen rather than the level size.
+The visible sprites are sorted by layer and handed to SDL in one batched call.
+"""
+import pygame
+
+# pygame-ce's Surface.fblits takes (surface, dest) pairs and builds no result list
+FBLITS = hasattr(pygame.Surface, "fblits")
+
+
+def layer_of(spr):
+    """Draw layer of a sprite (pygame's `_layer` convention, 0 when unset); lower layers are drawn first."""
+    return getattr(spr, "_layer", 0)
+
+
+def blit_pairs(surface, pairs):
+    """Blit a sequence of (image, dest) pairs onto `surface` in a single call."""
+    if FBLITS:
+        surface.fblits(pairs)
+    else:
+        surface.blits(pairs, False)
+
+
+class Viewport:
+    """
+    The visible part of the level, in screen coordinates (sprites are moved with the background).
+    margin: pixels around the screen in which sprites are still drawn
+    """
+
+    def __init__(self, size, margin=64):
+        self.rect = pygame.Rect((0, 0), size)
+        self.margin = margin
+        self.area = self.rect.inflate(2 * margin, 2 * margin)
+        self.culled = 0
+        self.visible_count = 0
+        self.frames = 0
+        self.total_culled = 0
+
+    def visible(self, sprites):
+        """
+        Return the sprites meeting the viewport in draw order (by layer, then insertion order)
+        and count the others as culled this frame.
+        """
+        sprites = list(sprites)
+        area = self.area
+        shown = [spr for spr in sprites if area.colliderect(spr.rect)]
+        # the sort is stable, so sprites of one layer keep the group's insertion order
+        shown.sort(key=layer_of)
+        self.visible_count = len(shown)
+        self.culled = len(sprites) - len(shown)
+        self.frames += 1
+        self.total_culled += self.culled
+        return shown
+
+    def draw(self, surface, sprites):
+        """Blit the `sprites` (from visible()) that meet the surface's clip rect, in one batched call."""
+        clip = surface.get_clip()
+        blit_pairs(surface, [(spr.image, spr.rect) for spr in sprites if clip.colliderect(spr.rect)])
+
+    def stats(self):
+        """Return a dict with the sprites drawn / culled last frame and the average culled per frame."""
+        average = self.total_culled / self.frames if self.frames else 0.0
+        return {"visible": self.visible_count, "culled": self.culled, "average_culled": round(average, 1)}
@@ -0,0 +1,80 @@
+"""
+date : 2026 january 20
+description : Time-sliced asset warm-up queue.
+Idle screens (the logo and the main menu) call step() once per frame with a small time
+budget, so gameplay images and sounds are loaded and pre-scaled while the player is
+looking at the logo, and starting a game only hits warm caches.
+"""
+import time
+from collections import deque
+import pygame
+
+
+class WarmupQueue:
+    """
+    A queue of (name, callable) loading tasks run a few at a time on the main thread.
+    A task that raises is recorded in `errors` and skipped, so a missing file never stops
+    the menus from working; the real load will report it later.
+    """
+
+    def __init__(self, tasks=()):
+        self._tasks = deque()
+        self.total = 0
+        self.done = 0
+        self.errors = []
+        self.seconds = 0.0
+        for name, func in tasks:
+            self.add(name, func)
+
+    def add(self, name, func):
+        """Queue `func` (called with no arguments) under a display `name`."""
+        self._tasks.append((name, func))
+        self.total += 1
+
+    @property
+    def finished(self):
+        return not self._tasks
+
+    @property
+    def progress(self):
+        """Fraction of tasks done, from 0.0 to 1.0."""
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def current(self):
+        """Name of the next task, or None when finished."""
+        return self._tasks[0][0] if self._tasks else None
+
+    def step(self, budget_ms=10):
+        """
+        Run queued tasks until `budget_ms` has been spent (at least one task per call).
+        Returns True when the queue is empty.
+        """
+        start = time.perf_counter()
+        deadline = start + budget_ms / 1000.0
+        while self._tasks:
+            name, func = self._tasks.popleft()
+            try:
+                func()
+            except Exception as e:
+                self.errors.append((name, e))
+            self.done += 1
+            if time.perf_counter() >= deadline:
+                break
+        self.seconds += time.perf_counter() - start
+        return self.finished
+
+    def run_all(self):
+        """Run every remaining task now."""
+        while self._tasks:
+            self.step(budget_ms=1000)
+
+    def draw_progress(self, surface, rect, color=(255, 220, 60), back=(40, 40, 40)):
+        """Draw a progress bar into `rect` (nothing once the queue is finished)."""
+        if self.finished:
+            return
+        rect = pygame.Rect(rect)
+        pygame.draw.rect(surface, back, rect)
+        filled = rect.copy()
+        filled.width = int(rect.width * self.progress)
+        pygame.draw.rect(surface, color, filled)
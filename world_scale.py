@@ -0,0 +1,82 @@
+"""
+date : 2026 january 20
+description : Reduced internal resolution for the level world.
+With a render scale below 1 the gameplay screen draws the level on an internal surface of
+size * scale (500x300 at 0.5): the background tiles are scaled from the level image at that
+resolution, and every sprite image is scaled down once and reused. The internal surface is
+then upscaled to the window with one transform.scale (or smoothscale) per frame. Game
+coordinates stay those of the window, only the world's pixels are fewer; the HUD, the menus
+and the story screens are still drawn at the window resolution.
+"""
+from collections import OrderedDict
+import pygame
+import background_tiles
+
+
+def scaled_size(size, scale):
+    """Return `size` (width, height) at `scale`, at least one pixel each way."""
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+class ScaledWorld:
+    """
+    Draws the background and sprites of a level at `scale` of the window `size`.
+    smooth: upscale with smoothscale (bilinear) instead of scale (nearest pixel)
+    capacity: number of scaled-down sprite images kept
+    """
+
+    def __init__(self, size, scale, smooth=False, capacity=512):
+        self.size = tuple(size)
+        self.scale = scale
+        self.smooth = smooth
+        self.capacity = capacity
+        self.surface = pygame.Surface(scaled_size(size, scale)).convert()
+        # id(image) -> (image, scaled image); holding the image keeps its id from being reused
+        self._images = OrderedDict()
+        self.scaled = 0
+
+    def image(self, image):
+        """Return `image` at the internal resolution, scaling it down on first use."""
+        key = id(image)
+        entry = self._images.get(key)
+        if entry is not None:
+            self._images.move_to_end(key)
+            return entry[1]
+        size = scaled_size(image.get_size(), self.scale)
+        if image.get_bitsize() in (24, 32):
+            small = pygame.transform.smoothscale(image, size)
+        else:
+            small = pygame.transform.scale(image, size)
+        self._images[key] = (image, small)
+        self.scaled += 1
+        if len(self._images) > self.capacity:
+            self._images.popitem(last=False)
+        return small
+
+    def tiles(self, tiles):
+        """Return the TiledBackground of the level image of `tiles`, at the internal resolution."""
+        return background_tiles.get_background(tiles.path, scaled_size((tiles.world_width, tiles.world_height), self.scale))
+
+    def _pos(self, pos):
+        return round(pos[0] * self.scale), round(pos[1] * self.scale)
+
+    def _upscale(self, surface, size, dest=None):
+        scale = pygame.transform.smoothscale if self.smooth else pygame.transform.scale
+        return scale(surface, size) if dest is None else scale(surface, size, dest)
+
+    def draw(self, target, background, sprites):
+        """
+        Draw `background` (a sprite.Background) and `sprites` (in draw order) at the internal
+        resolution, then upscale them over the whole of `target` (a surface of the window size).
+        """
+        self.tiles(background.tiles).draw(self.surface, *self._pos(background.rect.topleft))
+        self.surface.blits([(self.image(spr.image), self._pos(spr.rect.topleft)) for spr in sprites], False)
+        self._upscale(self.surface, target.get_size(), target)
+
+    def blit_pairs(self, target, pairs):
+        """Blit (image, rect) pairs onto `target` as they look in the upscaled world (inside its clip rect)."""
+        for image, rect in pairs:
+            small = self.image(image)
+            x, y = self._pos(rect.topleft)
+            size = scaled_size(small.get_size(), 1 / self.scale)
+            target.blit(self._upscale(small, size), (round(x / self.scale), round(y / self.scale)))